@@ -0,0 +1,134 @@
+"""
+Small timing harness shared by the benchmarks: throughput is measured
+with calls timed in batches big enough for the clock resolution not to
+matter, latency percentiles with calls timed one by one, minus the cost
+of reading the clock.
+"""
+
+import json
+import platform
+import subprocess
+import time
+from statistics import median, quantiles
+from typing import Any, Callable, Dict, List, Optional
+
+Result = Dict[str, float]
+
+# fast functions are called millions of times in the batches,
+# far more than needed for the percentiles of single calls
+MAX_LATENCY_CALLS = 20_000
+
+
+def _clock_overhead(calls: int = 1000) -> float:
+    """
+    :returns: median time between two consecutive clock readings, in nanoseconds
+    """
+    now = time.perf_counter_ns
+    deltas = []
+    for _ in range(calls):
+        start = now()
+        end = now()
+        deltas.append(end - start)
+    return median(deltas)
+
+
+def _latencies(func: Callable[[], Any], calls: int) -> List[float]:
+    now = time.perf_counter_ns
+    overhead = _clock_overhead()
+    latencies = []
+    for _ in range(calls):
+        start = now()
+        func()
+        end = now()
+        latencies.append(max(end - start - overhead, 0))
+    return latencies
+
+
+def measure(
+    func: Callable[[], Any], min_time: float = 0.2, samples: int = 50
+) -> Result:
+    """
+    :param func: function to benchmark
+    :param min_time: approximate total time spent measuring, in seconds
+    :param samples: number of timed batches
+
+    :returns: ops/sec, from the timed batches, and per-call
+        latency percentiles in nanoseconds
+    """
+    batch = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(batch):
+            func()
+        elapsed = time.perf_counter_ns() - start
+        if elapsed * samples >= min_time * 1e9 or batch >= 1 << 20:
+            break
+        batch *= 2
+
+    per_op = []
+    for _ in range(samples):
+        start = time.perf_counter_ns()
+        for _ in range(batch):
+            func()
+        per_op.append((time.perf_counter_ns() - start) / batch)
+
+    # at most as many calls as in the batches, so it takes at most as long
+    latencies = _latencies(func, max(min(batch * samples, MAX_LATENCY_CALLS), samples))
+    p50, p90, p99 = (quantiles(latencies, n=100)[i] for i in (49, 89, 98))
+    return {
+        "ops_per_sec": 1e9 / (sum(per_op) / len(per_op)),
+        "p50_ns": p50,
+        "p90_ns": p90,
+        "p99_ns": p99,
+    }
+
+
+def metadata() -> Dict[str, Optional[str]]:
+    try:
+        commit: Optional[str] = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def save(path: str, results: Dict[str, Result]) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"meta": metadata(), "results": results}, file, indent=2)
+
+
+def load(path: str) -> Dict[str, Result]:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def compare(
+    baseline: Dict[str, Result], current: Dict[str, Result], threshold: float
+) -> int:
+    """
+    Prints the ops/sec change of every benchmark present in both runs
+
+    :param threshold: relative slowdown (e.g. 0.1) reported as a regression
+
+    :returns: number of regressions
+    """
+    regressions = 0
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        ratio = result["ops_per_sec"] / baseline[name]["ops_per_sec"]
+        flag = ""
+        if ratio < 1 - threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{name:<48} {(ratio - 1) * 100:+7.1f}%{flag}")
+    return regressions
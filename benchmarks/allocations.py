@@ -0,0 +1,170 @@
+"""
+Memory allocated when resolving configuration, measured with
+:mod:`tracemalloc`. For every call it reports:
+
+* peak - the highest amount of memory, and number of memory blocks
+  (i.e. objects, mostly), allocated at once during the call: the
+  transient cost (accessor objects, closures, split strings, lists...)
+* retained - memory and number of blocks still allocated after the call,
+  e.g. the returned value or anything leaked into caches
+
+    python -m benchmarks.allocations
+
+The same helpers are used by ``tests/test_allocations.py`` to enforce
+thresholds.
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from statistics import median
+from typing import Any, Callable, Dict
+
+from env_var import EnvSchema, env
+
+
+@dataclass(frozen=True)
+class AllocStats:
+    peak_bytes: int
+    peak_blocks: int
+    retained_bytes: int
+    retained_blocks: int
+
+
+def _retained_blocks(snapshot: tracemalloc.Snapshot) -> int:
+    return sum(stat.count for stat in snapshot.statistics("filename"))
+
+
+def _noop() -> None:
+    pass
+
+
+def _peak_blocks(func: Callable[[], Any]) -> int:
+    # tracemalloc doesn't count blocks freed before the end of the call,
+    # so the number of allocated blocks is sampled on every call, line
+    # and return event of python code; allocations made and freed within
+    # a single C call are missed
+    getallocatedblocks = sys.getallocatedblocks
+    start = getallocatedblocks()
+    peak = [start]
+
+    def tracer(frame, event, arg):  # pylint: disable=unused-argument
+        blocks = getallocatedblocks()
+        if blocks > peak[0]:
+            peak[0] = blocks
+        return tracer
+
+    sys.settrace(tracer)
+    try:
+        func()
+    finally:
+        sys.settrace(None)
+    return peak[0] - start
+
+
+def measure_allocations(func: Callable[[], Any], repeat: int = 20) -> AllocStats:
+    """
+    :param func: function to measure; called once before measuring,
+        so one-time costs (lazy imports, caches) are not counted
+    :param repeat: number of measured calls, the median is reported
+
+    :returns: allocations of a single call
+    """
+    func()
+    was_tracing = tracemalloc.is_tracing()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    # tracers (e.g. coverage) allocate on every line executed
+    tracer = sys.gettrace()
+    sys.settrace(None)
+    try:
+        # sys.getallocatedblocks isn't affected by tracemalloc; the
+        # tracer's own allocations are measured on a function doing nothing
+        overhead = min(_peak_blocks(_noop) for _ in range(repeat))
+        peak_blocks = [max(_peak_blocks(func) - overhead, 0) for _ in range(repeat)]
+
+        if not was_tracing:
+            tracemalloc.start()
+        peaks, retained, blocks = [], [], []
+        for _ in range(repeat):
+            # also resets the peak, unlike tracemalloc.reset_peak
+            # it's available in python 3.8
+            tracemalloc.clear_traces()
+            # keeping the result alive, so it's counted as retained
+            result = func()
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            del result
+            peaks.append(peak)
+            retained.append(current)
+            blocks.append(_retained_blocks(snapshot))
+    finally:
+        sys.settrace(tracer)
+        if not was_tracing:
+            tracemalloc.stop()
+        if gc_was_enabled:
+            gc.enable()
+
+    return AllocStats(
+        peak_bytes=int(median(peaks)),
+        peak_blocks=int(median(peak_blocks)),
+        retained_bytes=int(median(retained)),
+        retained_blocks=int(median(blocks)),
+    )
+
+
+VAR_PREFIX = "ALLOC_BENCH_"
+
+
+class BenchSettings(EnvSchema):
+    port = env(f"{VAR_PREFIX}PORT").as_port_number()
+    workers = env(f"{VAR_PREFIX}WORKERS").as_int(min=1)
+    ratio = env(f"{VAR_PREFIX}RATIO").as_float(min=0, max=1)
+    debug = env(f"{VAR_PREFIX}DEBUG").as_bool()
+    name = env(f"{VAR_PREFIX}NAME").as_string()
+    hosts = env(f"{VAR_PREFIX}HOSTS").as_string_list()
+
+
+ENVIRON = {
+    f"{VAR_PREFIX}PORT": "8080",
+    f"{VAR_PREFIX}WORKERS": "4",
+    f"{VAR_PREFIX}RATIO": "0.5",
+    f"{VAR_PREFIX}DEBUG": "false",
+    f"{VAR_PREFIX}NAME": "service",
+    f"{VAR_PREFIX}HOSTS": "a,b,c",
+    f"{VAR_PREFIX}INTS": ",".join(str(i) for i in range(1000)),
+}
+
+_PORT = env(f"{VAR_PREFIX}PORT").as_port_number()
+_INTS = env(f"{VAR_PREFIX}INTS").as_int_list()
+_INTS_ITER = env(f"{VAR_PREFIX}INTS").as_list_iter(int)
+_compiled_load = BenchSettings.compile()
+
+CASES: Dict[str, Callable[[], Any]] = {
+    "env().as_int().required()": lambda: env(f"{VAR_PREFIX}WORKERS")
+    .as_int(min=1)
+    .required(),
+    "module level accessor .required()": _PORT.required,
+    "as_int_list[1000].required()": _INTS.required,
+    "as_list_iter[1000] summed": lambda: sum(_INTS_ITER.required()),
+    "EnvSchema.load()": BenchSettings.load,
+    "EnvSchema.compile()()": _compiled_load,
+}
+
+
+def main():
+    os.environ.update(ENVIRON)
+    for name, func in CASES.items():
+        stats = measure_allocations(func)
+        print(
+            f"{name:<36} peak {stats.peak_bytes:>8} B"
+            f" in {stats.peak_blocks:>5} blocks"
+            f"  retained {stats.retained_bytes:>8} B"
+            f" in {stats.retained_blocks:>5} blocks"
+        )
+
+
+if __name__ == "__main__":
+    main()
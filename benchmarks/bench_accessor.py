@@ -0,0 +1,52 @@
+"""
+Per call cost of building an accessor inline, compared with
+reusing one declared once at module level, and of handling
+an invalid value with an exception or a result object.
+
+    python -m benchmarks.bench_accessor
+"""
+
+import os
+
+from env_var import env
+from env_var.errors import EnvVarValidationError
+
+from ._harness import measure
+
+VAR_NAME = "BENCH_MAX_CONN"
+INVALID_VAR_NAME = "BENCH_INVALID_MAX_CONN"
+
+MAX_CONN = env(VAR_NAME).as_int(min=1)
+INVALID_MAX_CONN = env(INVALID_VAR_NAME).as_int(min=1)
+
+
+def inline():
+    return env(VAR_NAME).as_int(min=1).required()
+
+
+def invalid_raising():
+    try:
+        return INVALID_MAX_CONN.required()
+    except EnvVarValidationError:
+        return None
+
+
+def invalid_result():
+    return INVALID_MAX_CONN.try_required().unwrap_or(None)
+
+
+def main():
+    os.environ[VAR_NAME] = "100"
+    os.environ[INVALID_VAR_NAME] = "0"
+    for name, func in (
+        ('env("X").as_int(min=1).required()', inline),
+        ("MAX_CONN.required()", MAX_CONN.required),
+        ("invalid .required() + except", invalid_raising),
+        ("invalid .try_required()", invalid_result),
+    ):
+        result = measure(func)
+        print(f"{name:<36} {result['p50_ns']:>8,.0f} ns per call (p50)")
+
+
+if __name__ == "__main__":
+    main()
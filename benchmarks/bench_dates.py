@@ -0,0 +1,68 @@
+"""
+ISO 8601 parsing and RFC 3339 validation with the stdlib fast path
+of :mod:`env_var._transformers.date`, compared with dateutil and
+rfc3339_validator alone, and ISO 8601 durations parsed natively
+into timedeltas, compared with isoduration.
+
+    python -m benchmarks.bench_dates
+"""
+
+from functools import partial
+
+from dateutil.parser import isoparse
+from isoduration import parse_duration
+from rfc3339_validator import validate_rfc3339
+
+from env_var._transformers.date import (
+    _parse_fixed_duration,
+    iso_date_validator,
+    iso_datetime_transformer,
+    iso_timedelta_transformer,
+)
+
+from ._harness import measure
+
+INPUTS = (
+    "2022-04-09",
+    "2022-04-09T01:30:03",
+    "2022-04-09T01:30:03.602Z",
+    "2022-04-09T01:30:03.602+05:30",
+    # falls back to dateutil
+    "20220409T013003Z",
+)
+
+DURATIONS = ("PT30S", "P1D", "PT5M", "P1DT2H3M4.5S")
+
+
+def uncached_timedelta(s: str):
+    _parse_fixed_duration.cache_clear()
+    return iso_timedelta_transformer(s)
+
+
+def main():
+    for s in INPUTS:
+        cases = [
+            ("dateutil isoparse", isoparse),
+            ("iso_datetime_transformer", iso_datetime_transformer),
+        ]
+        if validate_rfc3339(s):
+            cases += [
+                ("validate_rfc3339", validate_rfc3339),
+                ("iso_date_validator", iso_date_validator),
+            ]
+        for name, func in cases:
+            result = measure(partial(func, s))
+            print(f"{s:<30} {name:<26} {result['p50_ns']:>8,.0f} ns")
+
+    for s in DURATIONS:
+        for name, func in (
+            ("isoduration parse_duration", parse_duration),
+            ("iso_timedelta (uncached)", uncached_timedelta),
+            ("iso_timedelta", iso_timedelta_transformer),
+        ):
+            result = measure(partial(func, s))
+            print(f"{s:<30} {name:<26} {result['p50_ns']:>8,.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
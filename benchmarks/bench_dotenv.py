@@ -0,0 +1,59 @@
+"""
+Parsing speed of :class:`env_var.sources.DotEnvSource` on large
+generated ``.env`` files, compared with a naive line by line parser.
+
+    python -m benchmarks.bench_dotenv
+"""
+
+import os
+import tempfile
+import timeit
+
+from env_var._sources.dotenv import parse_dotenv
+
+LINE_COUNTS = (10_000, 100_000)
+
+
+def generate(path: str, lines: int):
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(lines):
+            if i % 10 == 0:
+                file.write(f"# section {i}\n")
+            elif i % 3 == 0:
+                file.write(f'export SECRET_{i}="s3cr3t\\nvalue {i}"\n')
+            elif i % 3 == 1:
+                file.write(f"VAR_{i}='literal {i}'\n")
+            else:
+                file.write(f"VAR_{i}=plain-{i} # comment\n")
+
+
+def naive_parse(path: str):
+    values = {}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            key, _, val = line.partition("=")
+            values[key.strip()] = val.strip().strip("\"'")
+    return values
+
+
+def main(repeat: int = 3):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for lines in LINE_COUNTS:
+            path = os.path.join(tmp_dir, f"{lines}.env")
+            generate(path, lines)
+            for name, func in (
+                ("parse_dotenv", parse_dotenv),
+                ("naive line loop", naive_parse),
+            ):
+                best = min(timeit.repeat(lambda: func(path), number=1, repeat=repeat))
+                print(
+                    f"{lines:>7} lines  {name:<16} {best * 1e3:8.1f} ms"
+                    f"  {lines / best / 1e6:6.2f} M lines/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
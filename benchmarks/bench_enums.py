@@ -0,0 +1,63 @@
+"""
+Enum parsing with the lookup tables of
+:mod:`env_var._transformers.enums`, compared with calling the enum
+class, and with a case insensitive scan of the members.
+
+    python -m benchmarks.bench_enums
+"""
+
+from enum import Enum
+from functools import partial
+
+from env_var._transformers.enums import enum_transformer_factory
+
+from ._harness import measure
+
+
+class LogLevel(Enum):
+    CRITICAL = "critical"
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
+    DEBUG = "debug"
+    NOTSET = "notset"
+
+
+def enum_call(s: str):
+    try:
+        return LogLevel(s)
+    except ValueError:
+        return None
+
+
+def member_scan(s: str):
+    folded = s.casefold()
+    for member in LogLevel:
+        if member.value.casefold() == folded or member.name.casefold() == folded:
+            return member
+    return None
+
+
+def transform(transformer, s: str):
+    try:
+        return transformer(s)
+    except ValueError:
+        return None
+
+
+def main():
+    by_value = enum_transformer_factory(LogLevel)
+    lenient = enum_transformer_factory(LogLevel, by="both", case_sensitive=False)
+    for s in ("debug", "DEBUG", "nope"):
+        for name, func in (
+            ("LogLevel(s)", partial(enum_call, s)),
+            ("by value", partial(transform, by_value, s)),
+            ("member scan, no case", partial(member_scan, s)),
+            ("by both, no case", partial(transform, lenient, s)),
+        ):
+            result = measure(func)
+            print(f"{s:<8} {name:<22} {result['p50_ns']:>8,.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Membership checks against :class:`env_var.networks.NetworkSet`,
+compared with a linear scan over the parsed networks.
+
+    python -m benchmarks.bench_networks
+"""
+
+import ipaddress
+import random
+
+from env_var import env
+
+from ._harness import measure
+
+NETWORK_COUNTS = (10, 1_000, 10_000)
+
+
+def generate(count: int, seed: int = 0) -> str:
+    rand = random.Random(seed)
+    networks = []
+    for i in range(count):
+        if i % 10 == 0:
+            networks.append(f"{ipaddress.IPv6Address(rand.getrandbits(128))}/64")
+        else:
+            networks.append(f"{ipaddress.IPv4Address(rand.getrandbits(32))}/24")
+    return ",".join(str(ipaddress.ip_network(net, strict=False)) for net in networks)
+
+
+def main():
+    address = ipaddress.ip_address("192.0.2.1")
+    for count in NETWORK_COUNTS:
+        raw = generate(count)
+        index = env("NETWORKS", source={"NETWORKS": raw}).as_ip_network_list()
+        network_set = index.required()
+        networks = [ipaddress.ip_network(net) for net in raw.split(",")]
+        for name, func in (
+            ("NetworkSet.contains", lambda: address in network_set),
+            ("linear scan", lambda: any(address in net for net in networks)),
+        ):
+            result = measure(func, samples=10 if count > 1000 else 50)
+            print(f"{count:>6} networks {name:<20} {result['p50_ns']:>12,.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Matching an input against many patterns with
+:class:`env_var.patterns.PatternSet`, compared with
+a loop over the patterns compiled one by one.
+
+    python -m benchmarks.bench_patterns
+"""
+
+import re
+
+from env_var import env
+
+from ._harness import measure
+
+PATTERN_COUNTS = (10, 100, 1_000)
+
+
+def generate(count: int) -> str:
+    return ";".join(rf"/api/v\d+/resource{i}/[0-9a-f]{{8}}$" for i in range(count))
+
+
+def main():
+    inputs = ("/api/v2/resource7/deadbeef", "/static/app.js")
+    for count in PATTERN_COUNTS:
+        raw = generate(count)
+        pattern_set = (
+            env("PATTERNS", source={"PATTERNS": raw})
+            .as_pattern_list(split_on=";")
+            .required()
+        )
+        patterns = [re.compile(pattern) for pattern in raw.split(";")]
+        for s in inputs:
+            for name, func in (
+                ("PatternSet.match", lambda: pattern_set.match(s)),
+                ("loop", lambda: next((p for p in patterns if p.match(s)), None)),
+            ):
+                result = measure(func, samples=20)
+                print(
+                    f"{count:>5} patterns {s:<28} {name:<18} {result['p50_ns']:>10,.0f} ns"
+                )
+
+
+if __name__ == "__main__":
+    main()
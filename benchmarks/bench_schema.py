@@ -0,0 +1,48 @@
+"""
+Compares loading many variables through :class:`env_var.EnvSchema`
+(interpreted and compiled) with calling ``required()`` on every
+accessor separately.
+
+    python -m benchmarks.bench_schema
+"""
+
+import os
+import timeit
+from functools import partial
+
+from env_var import EnvSchema, env
+
+N_VARS = 150
+PREFIX = "BENCH_SCHEMA_"
+
+
+def make_schema():
+    namespace = {f"var_{i}": env(f"{PREFIX}{i}").as_int(min=0) for i in range(N_VARS)}
+    return type("BenchSettings", (EnvSchema,), namespace)
+
+
+def main(number: int = 200):
+    for i in range(N_VARS):
+        os.environ[f"{PREFIX}{i}"] = str(i)
+
+    schema = make_schema()
+    accessors = [env(f"{PREFIX}{i}").as_int(min=0) for i in range(N_VARS)]
+
+    def per_variable():
+        return [accessor.required() for accessor in accessors]
+
+    snapshot = dict(os.environ)
+    benchmarks = {
+        "per-variable required()": per_variable,
+        "EnvSchema.load()": schema.load,
+        "EnvSchema.load(dict)": partial(schema.load, snapshot),
+        "EnvSchema.compile()()": schema.compile(),
+        "EnvSchema.compile()(dict)": partial(schema.compile(), snapshot),
+    }
+    for name, func in benchmarks.items():
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:<27} {best / number * 1e6:10.1f} us per {N_VARS} vars")
+
+
+if __name__ == "__main__":
+    main()
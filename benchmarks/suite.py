@@ -0,0 +1,208 @@
+"""
+Throughput of every ``env.as_*`` accessor on valid and invalid input,
+and of the numeric list accessors on lists of various sizes.
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --compare results.json
+
+or ``make bench``.
+"""
+
+import argparse
+import sys
+from enum import Enum
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from env_var import env
+from env_var.env import _env
+from env_var.errors import EnvVarValidationError
+
+from ._harness import Result, compare, load, measure, save
+
+VAR_NAME = "BENCH_VAR"
+LIST_SIZES = (10, 1_000, 100_000)
+
+
+class Level(Enum):
+    DEBUG = "debug"
+    INFO = "info"
+    ERROR = "error"
+
+
+# accessor factory, valid value, invalid value
+CASES: Dict[str, Tuple[Callable[[env], _env], str, Optional[str]]] = {
+    "as_int": (lambda e: e.as_int(), "12345", "12a"),
+    "as_int(min,max)": (lambda e: e.as_int(min=0, max=100000), "12345", "-1"),
+    "as_int(base=16)": (lambda e: e.as_int(base=16), "ff", "fg"),
+    "as_int_positive": (lambda e: e.as_int_positive(), "1", "-1"),
+    "as_int_negative": (lambda e: e.as_int_negative(), "-1", "1"),
+    "as_float": (lambda e: e.as_float(), "1.5", "1.5a"),
+    "as_float_positive": (lambda e: e.as_float_positive(), "1.5", "-1.5"),
+    "as_float_negative": (lambda e: e.as_float_negative(), "-1.5", "1.5"),
+    "as_port_number": (lambda e: e.as_port_number(), "8080", "70000"),
+    "as_bool": (lambda e: e.as_bool(), "true", "maybe"),
+    "as_urlparse": (lambda e: e.as_urlparse(), "https://example.com/a?b=c", None),
+    "as_ip_address": (lambda e: e.as_ip_address(), "192.168.0.1", "192.168.0"),
+    "as_ip_network": (lambda e: e.as_ip_network(), "10.0.0.0/8", "10.0.0.1/8"),
+    "as_ip_interface": (lambda e: e.as_ip_interface(), "10.0.0.1/8", "10.0.0"),
+    "as_enum": (lambda e: e.as_enum(Level), "info", "INFO"),
+    "as_string": (lambda e: e.as_string(), "value", None),
+    "as_email": (lambda e: e.as_email(), "some.dude@example.com", "not an email"),
+    "as_uri": (lambda e: e.as_uri(), "https://example.com/a", "example.com"),
+    "as_uuid": (
+        lambda e: e.as_uuid(),
+        "d0b887b2-cb84-47c8-b796-a2351c91e070",
+        "d0b887b2-cb84-47c8-b796-a2351c91e07",
+    ),
+    "as_url": (lambda e: e.as_url(), "https://example.com/a?b=c", "example.com"),
+    "as_hostname": (lambda e: e.as_hostname(), "monet.example.com", "-example"),
+    "should_match": (lambda e: e.should_match(r"^[a-z]+-\d+$"), "abc-12", "abc"),
+    "as_iso_date": (
+        lambda e: e.as_iso_date(),
+        "2022-04-09T01:30:03.602Z",
+        "2022-13-09T01:30:03",
+    ),
+    "as_date": (lambda e: e.as_date(), "09/04/2022, 03:30:37", "not a date"),
+    "as_iso_duration": (lambda e: e.as_iso_duration(), "P3Y6M4DT12H30M5S", "P3X"),
+    "as_iso_date_string": (
+        lambda e: e.as_iso_date_string(),
+        "2022-04-09T01:30:03.602Z",
+        "2022-04-09T01:30:03",
+    ),
+    "as_string_list": (lambda e: e.as_string_list(), "a,b,c,d", None),
+    "as_enum(by=name)": (lambda e: e.as_enum(Level, by="name"), "INFO", "info"),
+    "as_enum(by=both,nocase)": (
+        lambda e: e.as_enum(Level, by="both", case_sensitive=False),
+        "Info",
+        "warn",
+    ),
+    "as_set": (lambda e: e.as_set(str), "a,b,c,d", "a,b,c,a"),
+    "as_frozenset": (lambda e: e.as_frozenset(int), "1,2,3,4", "1,2,3,x"),
+    "as_hostname_set": (
+        lambda e: e.as_hostname_set(),
+        "a.example.com,B.example.com",
+        "a.example.com,-example",
+    ),
+    "as_ip_network_list": (
+        lambda e: e.as_ip_network_list(),
+        "10.0.0.0/8,192.168.0.0/16,2001:db8::/32",
+        "10.0.0.0/8,10.0.0.1/8",
+    ),
+    "as_pattern_list": (
+        lambda e: e.as_pattern_list(split_on=";"),
+        r"^/api/v\d+/;^/static/",
+        r"^/api/v\d+/;(unclosed",
+    ),
+    "as_iso_timedelta": (lambda e: e.as_iso_timedelta(), "P1DT2H3M4.5S", "P1X"),
+    # items are only validated while iterating, see list_calls
+    "as_list_iter": (lambda e: e.as_list_iter(int), "1,2,3,4", None),
+}
+
+
+def accessor_calls() -> Iterator[Tuple[str, Callable[[], object]]]:
+    for name, (factory, valid, invalid) in CASES.items():
+        accessor = factory(env(VAR_NAME, source={VAR_NAME: valid}))
+        yield f"{name}[valid]", accessor.required
+
+        if invalid is None:
+            continue
+
+        def call_invalid(
+            accessor=factory(env(VAR_NAME, source={VAR_NAME: invalid})),
+            message=f"{name} accepted {invalid!r}",
+        ):
+            try:
+                accessor.required()
+            except EnvVarValidationError:
+                pass
+            else:
+                raise AssertionError(message)
+
+        yield f"{name}[invalid]", call_invalid
+
+
+def list_calls() -> Iterator[Tuple[str, Callable[[], object]]]:
+    for size in LIST_SIZES:
+        ints = ",".join(str(i) for i in range(size))
+        floats = ",".join(f"{i}.5" for i in range(size))
+        yield f"as_int_list[{size}]", env(
+            VAR_NAME, source={VAR_NAME: ints}
+        ).as_int_list(min_item_value=0).required
+        yield f"as_float_list[{size}]", env(
+            VAR_NAME, source={VAR_NAME: floats}
+        ).as_float_list(min_item_value=0).required
+        yield f"as_int_array[{size}]", env(
+            VAR_NAME, source={VAR_NAME: ints}
+        ).as_int_array(min_item_value=0).required
+        yield f"as_float_array[{size}]", env(
+            VAR_NAME, source={VAR_NAME: floats}
+        ).as_float_array(min_item_value=0).required
+
+        def consume_iter(
+            accessor=env(VAR_NAME, source={VAR_NAME: ints}).as_list_iter(int)
+        ):
+            return sum(accessor.required())
+
+        def consume_invalid_iter(
+            accessor=env(VAR_NAME, source={VAR_NAME: ints + ",x"}).as_list_iter(int)
+        ):
+            try:
+                sum(accessor.required())
+            except EnvVarValidationError:
+                pass
+            else:
+                raise AssertionError("as_list_iter accepted an invalid item")
+
+        yield f"as_list_iter[{size}][valid]", consume_iter
+        yield f"as_list_iter[{size}][invalid]", consume_invalid_iter
+
+
+def run(name_filter: str, min_time: float) -> Dict[str, Result]:
+    results = {}
+    for name, func in (*accessor_calls(), *list_calls()):
+        if name_filter not in name:
+            continue
+        # huge lists take milliseconds per call, fewer samples are enough
+        samples = 10 if "[100000]" in name else 50
+        results[name] = result = measure(func, min_time=min_time, samples=samples)
+        print(
+            f"{name:<32} {result['ops_per_sec']:>12,.0f} ops/s"
+            f"  p50 {result['p50_ns']:>12,.0f} ns"
+            f"  p99 {result['p99_ns']:>12,.0f} ns"
+        )
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="save results as JSON")
+    parser.add_argument("--compare", help="JSON results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default: 0.1)",
+    )
+    parser.add_argument(
+        "--filter", default="", help="run only benchmarks containing this string"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="approximate time spent on each benchmark, in seconds",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.min_time)
+    if args.output:
+        save(args.output, results)
+    if args.compare:
+        print()
+        if compare(load(args.compare), results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
 from .env import env
+from .schema import EnvSchema, optional
 
-__all__ = ["env"]
+__version__ = "1.0.1"
+
+__all__ = ["env", "EnvSchema", "optional"]
@@ -0,0 +1,211 @@
+"""
+Generates a single Python function loading all the fields of an
+:class:`~env_var.schema.EnvSchema`. Numeric transformers are inlined
+(conversion and bounds checks), other transformers are called directly,
+skipping the per-accessor method calls of :meth:`~env_var.env._env.required`.
+"""
+
+import math
+import os
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ._transformers.numeric import NumTransformer
+from .env import _env
+from .errors import EnvSchemaError, EnvVarNotDefinedError, EnvVarValidationError
+from .instrumentation import _hooks
+
+Loader = Callable[..., Any]
+
+
+def _literal(val: Any) -> Optional[str]:
+    """
+    :returns: source code literal of ``val``, if it can be inlined safely
+    """
+    # subclasses (bool, IntEnum...) may have reprs that aren't literals
+    if type(val) not in (int, float):  # pylint: disable=unidiomatic-typecheck
+        return None
+    if isinstance(val, float) and not math.isfinite(val):
+        return None
+    return repr(val)
+
+
+class _Generator:
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.globals: Dict[str, Any] = {
+            "EnvSchemaError": EnvSchemaError,
+            "EnvVarNotDefinedError": EnvVarNotDefinedError,
+            "EnvVarValidationError": EnvVarValidationError,
+            "os_environ": os.environ,
+            "set_field": object.__setattr__,
+        }
+
+    def add_global(self, prefix: str, val: Any) -> str:
+        """
+        :returns: name of a new global of the generated code holding ``val``
+        """
+        name = f"{prefix}{len(self.globals)}"
+        self.globals[name] = val
+        return name
+
+    def bound(self, val: Any) -> str:
+        """
+        :returns: literal of a min/max bound, or the name of a global holding it
+        """
+        literal = _literal(val)
+        return self.add_global("bound_", val) if literal is None else literal
+
+    def emit(self, indent: int, line: str) -> None:
+        """
+        Appends a line of code, indented by ``indent`` levels
+        """
+        self.lines.append("    " * indent + line)
+
+    def emit_transform(self, transformer: Callable[[str], Any], indent: int) -> None:
+        """
+        Emits code setting ``val`` to the transformed ``raw``; numeric
+        conversion and bounds checks are inlined
+        """
+        if not isinstance(transformer, NumTransformer):
+            self.emit(
+                indent, f"val = {self.add_global('transformer_', transformer)}(raw)"
+            )
+            return
+
+        type_ = self.add_global("type_", transformer.type_)
+        if transformer.base is None:
+            self.emit(indent, f"val = {type_}(raw)")
+        else:
+            self.emit(indent, f"val = {type_}(raw, {transformer.base!r})")
+
+        if transformer.min is not None:
+            msg = f"should be bigger or equal {transformer.min}"
+            self.emit(indent, f"if val < {self.bound(transformer.min)}:")
+            self.emit(indent + 1, f"raise ValueError({msg!r})")
+
+        if transformer.max is not None:
+            msg = f"should be less or equal {transformer.max}"
+            self.emit(indent, f"if val > {self.bound(transformer.max)}:")
+            self.emit(indent + 1, f"raise ValueError({msg!r})")
+
+    def emit_field(self, attr: str, accessor: _env, required: bool) -> None:
+        """
+        Emits code resolving a field, setting it on ``instance``
+        or appending the error to ``errors``
+        """
+        # pylint: disable=protected-access
+        (
+            var_name,
+            transformer,
+            source,
+            default,
+            cache,
+            file_suffix,
+        ) = accessor._components()
+
+        if file_suffix is not None:
+            # reading files dominates anyway, no point in inlining
+            self.emit_delegated_field(attr, accessor, required)
+            return
+
+        if source is None:
+            self.emit(1, f"raw = get({var_name!r})")
+        else:
+            source_name = self.add_global("source_", source)
+            self.emit(1, f"raw = {source_name}.get({var_name!r})")
+        self.emit(1, "if raw is None:")
+        if default is not None:
+            self.emit(
+                2,
+                f"set_field(instance, {attr!r}, {self.add_global('default_', default)})",
+            )
+        elif required:
+            self.emit(2, f"errors.append(EnvVarNotDefinedError({var_name!r}))")
+        else:
+            self.emit(2, f"set_field(instance, {attr!r}, None)")
+        self.emit(1, "else:")
+        self.emit(2, "try:")
+        if cache is None:
+            self.emit_transform(transformer, 3)
+        else:
+            cache_name = self.add_global("cache_", cache)
+            transformer_name = self.add_global("transformer_", transformer)
+            self.emit(
+                3,
+                f"val = {cache_name}.get_or_parse(({var_name!r}, raw, {transformer_name}))",
+            )
+        self.emit(2, "except ValueError as err:")
+        self.emit(3, f"errors.append(EnvVarValidationError({var_name!r}, *err.args))")
+        self.emit(2, "else:")
+        self.emit(3, f"set_field(instance, {attr!r}, val)")
+
+    def emit_delegated_field(self, attr: str, accessor: _env, required: bool) -> None:
+        """
+        Like :meth:`emit_field`, but resolving the field with
+        the accessor itself instead of inlined code
+        """
+        accessor_name = self.add_global("accessor_", accessor)
+        self.emit(1, "try:")
+        self.emit(2, f"val = {accessor_name}._parse({accessor_name}._raw(environ))")
+        self.emit(1, "except EnvVarValidationError as err:")
+        self.emit(2, "errors.append(err)")
+        if required:
+            self.emit(1, "else:")
+            self.emit(2, "if val is None:")
+            self.emit(
+                3,
+                f"errors.append(EnvVarNotDefinedError({accessor.var_name!r}))",
+            )
+            self.emit(2, "else:")
+            self.emit(3, f"set_field(instance, {attr!r}, val)")
+        else:
+            self.emit(1, "else:")
+            self.emit(2, f"set_field(instance, {attr!r}, val)")
+
+
+def compile_loader(
+    cls: type,
+    fields: Mapping[str, Tuple[_env, bool]],
+    name: str = "load",
+    fallback: Optional[Loader] = None,
+) -> Loader:
+    """
+    :param cls: class of the instance returned by the loader
+    :param fields: mapping of attribute names to accessors and
+        a flag telling if the field is required
+    :param fallback: loader called instead while instrumentation
+        hooks are registered, the generated code doesn't emit events
+
+    :returns: function taking an optional mapping of environment
+        variables (:data:`os.environ` by default) and returning
+        an instance of ``cls``
+    """
+    gen = _Generator()
+    gen.globals["cls"] = cls
+    gen.emit(0, f"def {name}(environ=None):")
+    if fallback is not None:
+        gen.globals["hooks"] = _hooks
+        gen.globals["fallback"] = fallback
+        gen.emit(1, "if hooks:")
+        gen.emit(2, "return fallback(environ)")
+    gen.emit(1, "if environ is None:")
+    gen.emit(2, "environ = os_environ")
+    gen.emit(1, "get = environ.get")
+    gen.emit(1, "instance = cls.__new__(cls)")
+    gen.emit(1, "errors = []")
+    for attr, (accessor, required) in fields.items():
+        gen.emit_field(attr, accessor, required)
+    gen.emit(1, "if errors:")
+    gen.emit(2, "raise EnvSchemaError(errors)")
+    gen.emit(1, "return instance")
+
+    source = "\n".join(gen.lines)
+    namespace: Dict[str, Any] = {}
+    exec(  # pylint: disable=exec-used
+        compile(source, f"<env_var compiled {cls.__qualname__}>", "exec"),
+        gen.globals,
+        namespace,
+    )
+    loader = namespace[name]
+    loader.__source__ = source
+    return loader
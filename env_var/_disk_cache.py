@@ -0,0 +1,132 @@
+"""
+On-disk cache of loaded :class:`~env_var.schema.EnvSchema` instances,
+so processes restarted with an identical environment can skip
+running the transformers again.
+
+The file starts with a hex digest of everything the result depends on,
+followed by the pickled instance; it's read in one go and discarded
+on any mismatch.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from dataclasses import fields, is_dataclass
+from typing import Any, Mapping, Optional
+
+from .errors import EnvVarValidationError
+
+_KEY_SIZE = hashlib.sha256().digest_size * 2
+
+
+def _transformer_id(transformer: Any) -> str:
+    if is_dataclass(transformer) and not isinstance(transformer, type):
+        # built-in transformers are identified by their parameters; nested
+        # callables by name, their reprs would differ between processes
+        params = ", ".join(
+            f"{field.name}={_param_id(getattr(transformer, field.name))}"
+            for field in fields(transformer)
+        )
+        return f"{_transformer_id(type(transformer))}({params})"
+    module = getattr(transformer, "__module__", None)
+    name = getattr(transformer, "__qualname__", type(transformer).__qualname__)
+    return f"{module}.{name}"
+
+
+def _param_id(val: Any) -> str:
+    return _transformer_id(val) if callable(val) else repr(val)
+
+
+def _module_mtime(cls: type) -> Optional[int]:
+    path = getattr(sys.modules.get(cls.__module__), "__file__", None)
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _raw_repr(accessor: Any, environ: Mapping[str, str]) -> str:
+    try:
+        return repr(accessor._raw(environ))  # pylint: disable=protected-access
+    except EnvVarValidationError as err:
+        # e.g. an unreadable secret file; nothing is cached for
+        # such keys, as loading reports the error like load() does
+        return f"error: {err}"
+
+
+def cache_key(cls: Any, environ: Mapping[str, str]) -> bytes:
+    """
+    :returns: hex digest of the library version, the schema
+        definition and the raw values of its variables
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from . import __version__
+
+    parts = [
+        __version__,
+        f"{cls.__module__}.{cls.__qualname__}",
+        repr(_module_mtime(cls)),
+    ]
+    for attr, (accessor, required) in cls.__fields__.items():
+        # pylint: disable=protected-access
+        var_name, transformer, _, default, _, file_suffix = accessor._components()
+        parts.extend(
+            (
+                attr,
+                var_name,
+                repr(required),
+                _transformer_id(transformer),
+                repr(default),
+                repr(file_suffix),
+                _raw_repr(accessor, environ),
+            )
+        )
+
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogateescape"))
+        digest.update(b"\0")
+    return digest.hexdigest().encode("ascii")
+
+
+def read(path: str, key: bytes) -> Any:
+    """
+    :returns: cached instance, or None if the file is missing,
+        unreadable or was written for a different key
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    if data[:_KEY_SIZE] != key:
+        return None
+    try:
+        return pickle.loads(data[_KEY_SIZE:])
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def write(path: str, key: bytes, instance: Any) -> None:
+    """
+    Atomically replaces the cache file; failures are ignored,
+    as the cache is just an optimization
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".env_var-")
+        try:
+            with os.fdopen(tmp_fd, "wb") as file:
+                file.write(key)
+                pickle.dump(instance, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        pass
@@ -0,0 +1,103 @@
+import codecs
+import mmap
+import os
+import re
+from typing import Dict, Union
+
+# every line of the file is matched by exactly one of the alternatives,
+# so re.findall walks the whole buffer in a single pass
+_LINE = re.compile(
+    rb"""
+    [ \t]*
+    (?:
+        (?:export[ \t]+)?
+        (?P<key>[A-Za-z_][A-Za-z0-9_.-]*)
+        [ \t]*=[ \t]*
+        (?:
+            '(?P<single>[^']*)' [ \t]* (?:\#[^\r\n]*)?
+          | "(?P<double>[^"\\]*(?:\\[\s\S][^"\\]*)*)" [ \t]* (?:\#[^\r\n]*)?
+          | (?P<bare>(?![ \t'"])[^ \t\r\n]*(?:[ \t]+[^ \t\r\n\#][^ \t\r\n]*)*)
+            [ \t]* (?:\#[^\r\n]*)?
+        )
+      | (?:\#[^\r\n]*)?
+      | (?P<error>[^\r\n]+)
+    )
+    (?:\r\n|\r|\n|\Z)
+    """,
+    re.VERBOSE,
+)
+_ESCAPE = re.compile(rb"\\([\s\S])")
+_ESCAPES = {
+    b"n": b"\n",
+    b"r": b"\r",
+    b"t": b"\t",
+    b'"': b'"',
+    b"'": b"'",
+    b"\\": b"\\",
+}
+# escapes other than these are kept as they are
+_UNSUPPORTED_ESCAPE = re.compile(rb"\\[^nrt\"'\\]")
+
+
+def _unescape_match(match: "re.Match[bytes]") -> bytes:
+    return _ESCAPES.get(match.group(1), match.group(0))
+
+
+def _unescape(val: bytes) -> bytes:
+    if _UNSUPPORTED_ESCAPE.search(val) is None:
+        # C implementation, handling the supported escapes the same way
+        return codecs.escape_decode(val)[0]  # type: ignore
+    return _ESCAPE.sub(_unescape_match, val)
+
+
+def _raise_invalid_line(buf: Union[bytes, mmap.mmap], name: str):
+    for match in _LINE.finditer(buf):
+        if match.group("error") is not None:
+            line = buf[: match.start()].count(b"\n") + 1
+            raise ValueError(f"{name}:{line}: invalid line")
+
+
+def parse_dotenv_bytes(buf: Union[bytes, mmap.mmap], name: str = "<bytes>"):
+    """
+    Parses contents of a ``.env`` file:
+
+    * empty lines and lines starting with ``#`` are skipped
+    * ``KEY=value`` lines, optionally prefixed with ``export``
+    * unquoted values are stripped, `` #`` starts an inline comment
+    * single quoted values are taken literally
+    * double quoted values support ``\\n``, ``\\r``, ``\\t``, ``\\"``,
+      ``\\'`` and ``\\\\`` escapes
+    * quoted values may span multiple lines
+
+    Variables are not expanded.
+
+    :raises ValueError: on the first invalid line
+    """
+    values: Dict[str, str] = {}
+    # findall is the fastest way of going through the buffer, but it
+    # loses match positions, needed only to report an invalid line
+    for key, single, double, bare, error in _LINE.findall(buf):
+        if error:
+            _raise_invalid_line(buf, name)
+        if not key:
+            continue
+        if bare:
+            val = bare
+        elif double:
+            val = _unescape(double) if b"\\" in double else double
+        else:
+            val = single
+        values[key.decode("ascii")] = val.decode("utf-8")
+    return values
+
+
+def parse_dotenv(path: Union[str, os.PathLike]) -> Dict[str, str]:
+    """
+    Parses a ``.env`` file, see :func:`parse_dotenv_bytes`;
+    the file is memory mapped rather than read into memory
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return parse_dotenv_bytes(buf, os.fspath(path))
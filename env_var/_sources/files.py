@@ -0,0 +1,42 @@
+import os
+from threading import Lock
+from typing import Dict, Tuple, Union
+
+StatKey = Tuple[int, int, int]
+
+_cache: Dict[str, Tuple[StatKey, str]] = {}
+_lock = Lock()
+
+
+def stat_key(stat: os.stat_result) -> StatKey:
+    """
+    :returns: inode, mtime and size of a file, which change
+        whenever the file is replaced or modified
+    """
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def read_value(path: Union[str, "os.PathLike[str]"]) -> str:
+    """
+    :returns: contents of the file with trailing newlines stripped,
+        the way ``$(cat file)`` would do in a shell
+    """
+    with open(path, encoding="utf-8") as file:
+        return file.read().rstrip("\r\n")
+
+
+def read_value_cached(path: str) -> str:
+    """
+    Like :func:`read_value`, but the contents are cached
+    until the :func:`stat_key` of the file changes, so
+    a call costs a single ``stat`` as long as it doesn't
+    """
+    key = stat_key(os.stat(path))
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    val = read_value(path)
+    with _lock:
+        _cache[path] = (key, val)
+    return val
@@ -0,0 +1,128 @@
+from array import array
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Any, Iterable, List, Optional, Type
+
+from .base import DataclassTransformer
+from .numeric import NumericType, NumTransformer, num_transformer_factory
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore  # pylint: disable=invalid-name
+
+_TYPECODES = {int: "q", float: "d"}
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+@dataclass(frozen=True)
+class ArrayTransformer(DataclassTransformer):
+    """
+    Callable parsing a separated list of numbers into a
+    :class:`numpy.ndarray`, or an :class:`array.array` when
+    numpy is not installed. Items are converted in a single
+    pass in C, bounds are checked on the whole array; items
+    are looked at one by one only to report a failure.
+    """
+
+    __slots__ = ("item", "split_on", "use_numpy")
+
+    item: NumTransformer
+    split_on: str
+    use_numpy: bool
+
+    def __call__(self, s: str) -> Any:
+        items = s.split(self.split_on)
+        try:
+            values = self.__convert(items)
+        except (ValueError, OverflowError):
+            self.__raise_invalid_item(items)
+            raise
+        self.__check_bounds(values)
+        return values
+
+    def __convert(self, items: List[str]) -> Any:
+        type_, base = self.item.type_, self.item.base
+        if self.use_numpy:
+            dtype = numpy.int64 if type_ is int else numpy.float64
+            if base is None or base == 10:
+                # numpy converts the strings the same way int/float do
+                return numpy.array(items, dtype=dtype)
+            return numpy.fromiter(
+                map(int, items, repeat(base)), dtype=dtype, count=len(items)
+            )
+        converted: Iterable[Any]
+        if base is None or base == 10:
+            converted = map(type_, items)
+        else:
+            converted = map(int, items, repeat(base))
+        return array(_TYPECODES[type_], converted)
+
+    def __raise_invalid_item(self, items: List[str]):
+        type_, base = self.item.type_, self.item.base
+        for index, item in enumerate(items):
+            try:
+                val = type_(item) if base is None else int(item, base)
+            except ValueError:
+                raise ValueError(
+                    f"item {index} ({item!r}) is not a valid {type_.__name__}"
+                ) from None
+            if type_ is int and not _INT64_MIN <= val <= _INT64_MAX:
+                raise ValueError(f"item {index} ({item!r}) doesn't fit in a 64-bit int")
+
+    def __check_bounds(self, values: Any):
+        min_, max_ = self.item.min, self.item.max
+        if self.use_numpy:
+            out_of_bounds = None
+            if min_ is not None:
+                out_of_bounds = values < min_
+            if max_ is not None:
+                above = values > max_
+                out_of_bounds = (
+                    above if out_of_bounds is None else out_of_bounds | above
+                )
+            if out_of_bounds is not None and out_of_bounds.any():
+                index = int(out_of_bounds.argmax())
+                if min_ is not None and values[index] < min_:
+                    _raise_below(index, min_)
+                _raise_above(index, max_)
+            return
+
+        # min/max go through the array in C, it's enumerated only on failure
+        if values and (
+            (min_ is not None and min(values) < min_)
+            or (max_ is not None and max(values) > max_)
+        ):
+            for index, val in enumerate(values):
+                if min_ is not None and val < min_:
+                    _raise_below(index, min_)
+                if max_ is not None and val > max_:
+                    _raise_above(index, max_)
+
+
+def _raise_below(index: int, min_: Any):
+    raise ValueError(f"item {index} should be bigger or equal {min_}")
+
+
+def _raise_above(index: int, max_: Any):
+    raise ValueError(f"item {index} should be less or equal {max_}")
+
+
+def array_transformer_factory(
+    type_: Type[NumericType],
+    split_on: str = ",",
+    min: Optional[NumericType] = None,  # pylint: disable=redefined-builtin
+    max: Optional[NumericType] = None,  # pylint: disable=redefined-builtin
+    base: Optional[int] = None,
+    use_numpy: Optional[bool] = None,
+) -> ArrayTransformer:
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("numpy is not installed")
+    return ArrayTransformer(
+        num_transformer_factory(type_, min=min, max=max, base=base),
+        split_on,
+        use_numpy,
+    )
@@ -0,0 +1,21 @@
+from dataclasses import fields
+from typing import Any, Callable
+
+
+class DataclassTransformer:
+    """
+    Base of the transformers declared as frozen slotted dataclasses,
+    which can't be unpickled by default; they are pickled as a call
+    of :meth:`_factory` with the values of their fields
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _factory(cls) -> Callable[..., Any]:
+        return cls
+
+    def __reduce__(self):
+        return self._factory(), tuple(
+            getattr(self, field.name) for field in fields(self)  # type: ignore
+        )
@@ -1,16 +1,92 @@
-from dateutil import parser
-from isoduration import parse_duration
+# pylint: disable=import-outside-toplevel
+import re
+from datetime import date, datetime, timedelta, tzinfo
+from decimal import Decimal
+from functools import lru_cache
+from typing import Dict, Optional
+
+from dateutil import parser, tz
 from rfc3339_validator import validate_rfc3339
 
+# the common shapes are handled by the C implemented datetime.fromisoformat;
+# anything else (week dates, basic format, 24:00, comma fractions...) falls
+# back to dateutil, so results are the same as with isoparse alone
+_ISO_DATETIME = re.compile(
+    r"([0-9]{4}-[0-9]{2}-[0-9]{2})"
+    r"(?:(T[0-9]{2}:[0-9]{2}:[0-9]{2})(?:\.([0-9]+))?"
+    r"(?:(Z)|([+-])([0-9]{2}):([0-9]{2}))?)?"
+)
+# a subset of rfc3339_validator's regex, the date is checked by
+# date.fromisoformat instead of calendar.monthrange
+_RFC3339 = re.compile(
+    r"[0-9]{4}-(?:0[1-9]|1[0-2])-[0-9]{2}"
+    r"T(?:[01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](?:\.[0-9]+)?"
+    r"(?:Z|[+-](?:[01][0-9]|2[0-3]):[0-5][0-9])"
+)
+
 
 def iso_date_validator(s: str):
-    if not validate_rfc3339(s):
-        raise ValueError(f"{s} is not a valid rfc3339 date string")
-    return s
+    if _RFC3339.fullmatch(s) is not None:
+        try:
+            # also rejects year 0, like validate_rfc3339
+            date.fromisoformat(s[:10])
+            return s
+        except ValueError:
+            pass
+    elif validate_rfc3339(s):
+        return s
+    raise ValueError(f"{s} is not a valid rfc3339 date string")
+
+
+# dateutil caches only a few recent tzoffset instances, at most
+# 2 * 24 * 60 different offsets can be parsed here
+_offsets: Dict[int, tzinfo] = {}
+
+
+def _tzoffset(seconds: int) -> tzinfo:
+    offset = _offsets.get(seconds)
+    if offset is None:
+        offset = _offsets[seconds] = tz.tzoffset(None, seconds)
+    return offset
+
+
+def _fast_isoparse(s: str):
+    match = _ISO_DATETIME.fullmatch(s)
+    if match is None:
+        return None
+    day, time, fraction, utc, sign, hours, minutes = match.groups()
+    try:
+        if fraction is not None:
+            # isoparse truncates fractions to microseconds
+            naive = datetime.fromisoformat(f"{day}{time}.{fraction[:6]:0<6}")
+        else:
+            naive = datetime.fromisoformat(day if time is None else day + time)
+    except ValueError:
+        return None
+
+    if utc is not None:
+        offset_tz = tz.UTC
+    elif sign is None:
+        return naive
+    else:
+        offset_hours, offset_minutes = int(hours), int(minutes)
+        if offset_hours == 0 and offset_minutes == 0:
+            # isoparse returns UTC for any zero offset, -00:00 included
+            offset_tz = tz.UTC
+        elif offset_hours > 23 or offset_minutes > 59:
+            return None
+        else:
+            offset = (offset_hours * 60 + offset_minutes) * 60
+            offset_tz = _tzoffset(-offset if sign == "-" else offset)
+    # noticeably faster than naive.replace(tzinfo=...)
+    return datetime.combine(naive, naive.time(), offset_tz)
 
 
 def iso_datetime_transformer(s: str):
-    return parser.isoparse(s)
+    val = _fast_isoparse(s)
+    if val is None:
+        return parser.isoparse(s)
+    return val
 
 
 def datetime_transformer(s: str):
@@ -18,4 +94,56 @@ def datetime_transformer(s: str):
 
 
 def iso_duration_transformer(s: str):
+    # isoduration is imported only when actually used
+    from isoduration import parse_duration
+
     return parse_duration(s)
+
+
+_NUMBER = r"([0-9]+(?:[.,][0-9]+)?)"
+# durations of a fixed length: weeks, or days and time; years and
+# months depend on the date they are added to
+_FIXED_DURATION = re.compile(
+    rf"([-+])?P(?=[0-9T])(?:{_NUMBER}W|(?:{_NUMBER}D)?"
+    rf"(?:T(?=[0-9])(?:{_NUMBER}H)?(?:{_NUMBER}M)?(?:{_NUMBER}S)?)?)"
+)
+# weeks, days, hours, minutes, seconds
+_MICROSECONDS = (604_800_000_000, 86_400_000_000, 3_600_000_000, 60_000_000, 1_000_000)
+
+
+@lru_cache(maxsize=256)
+def _parse_fixed_duration(s: str) -> Optional[timedelta]:
+    # timedeltas are immutable, so results can be shared
+    match = _FIXED_DURATION.fullmatch(s)
+    if match is None:
+        return None
+    sign, *parts = match.groups()
+    total = 0
+    for part, unit in zip(parts, _MICROSECONDS):
+        if part is None:
+            continue
+        # fractions are summed exactly, and rounded once, like timedelta does
+        number = int(part) if part.isdigit() else Decimal(part.replace(",", "."))
+        total += number * unit
+    try:
+        val = timedelta(microseconds=round(total))
+    except OverflowError:
+        raise ValueError(f"{s} is out of range") from None
+    return -val if sign == "-" else val
+
+
+def iso_timedelta_transformer(s: str):
+    val = _parse_fixed_duration(s)
+    if val is not None:
+        return val
+    # calendar relative durations (years, months) and less common forms
+    duration = iso_duration_transformer(s)
+    if duration.date.years or duration.date.months:
+        return duration
+    days = duration.date.weeks * 7 + duration.date.days
+    seconds = duration.time.hours * 3600 + duration.time.minutes * 60
+    seconds += duration.time.seconds
+    try:
+        return timedelta(microseconds=round((days * 86_400 + seconds) * 1_000_000))
+    except OverflowError:
+        raise ValueError(f"{s} is out of range") from None
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Generic, Tuple, Type, TypeVar
+
+from .base import DataclassTransformer
+
+EnumType = TypeVar("EnumType", bound=Enum)  # pylint: disable=invalid-name
+
+MATCH_BY = ("value", "name", "both")
+
+# lookup table, and the valid choices appended to error messages
+_Lookup = Tuple[Dict[str, Enum], str]
+# built once per enum class and options; a weak key dictionary wouldn't
+# help, the members in the tables keep their enum class alive anyway
+_lookups: Dict[Tuple[Type[Enum], str, bool], _Lookup] = {}
+
+
+def _add(table: Dict[str, Enum], key: str, member: Enum, case_sensitive: bool) -> None:
+    if not case_sensitive:
+        key = key.casefold()
+    other = table.setdefault(key, member)
+    if other is not member:
+        raise ValueError(f"{key!r} matches both {other} and {member}")
+
+
+def _build_lookup(
+    enum: Type[Enum], by: str, case_sensitive: bool  # pylint: disable=invalid-name
+) -> _Lookup:
+    names: Dict[str, Enum] = {}
+    values: Dict[str, Enum] = {}
+    choices = []
+    # aliases included, like enum[name] and enum(value)
+    for name, member in enum.__members__.items():
+        is_alias = name != member.name
+        if by != "value":
+            _add(names, name, member, case_sensitive)
+            if not is_alias:
+                choices.append(name)
+        # only string values can be equal to the raw value
+        if by != "name" and isinstance(member.value, str):
+            _add(values, member.value, member, case_sensitive)
+            if not is_alias:
+                choices.append(member.value)
+    # values take precedence, like in enum(value)
+    table = {**names, **values}
+    if not choices:
+        return table, ""
+    return table, ", expected one of: " + ", ".join(map(repr, dict.fromkeys(choices)))
+
+
+def _lookup(
+    enum: Type[Enum], by: str, case_sensitive: bool  # pylint: disable=invalid-name
+) -> _Lookup:
+    key = (enum, by, case_sensitive)
+    lookup = _lookups.get(key)
+    if lookup is None:
+        lookup = _lookups.setdefault(key, _build_lookup(enum, by, case_sensitive))
+    return lookup
+
+
+def _has_custom_missing(enum: Type[Enum]) -> bool:
+    missing = enum._missing_  # pylint: disable=protected-access
+    return getattr(missing, "__func__", None) is not Enum._missing_.__func__  # type: ignore
+
+
+@dataclass(frozen=True)
+class EnumTransformer(DataclassTransformer, Generic[EnumType]):
+    """
+    Callable parsing a string into an enum member with a single
+    dict lookup, matching member values, names, or both.
+    When matching values, ``_missing_`` of the enum, if defined,
+    is called for strings not found in the table.
+    """
+
+    __slots__ = ("enum", "by", "case_sensitive", "_table", "_choices", "_missing")
+
+    enum: Type[EnumType]
+    by: str  # pylint: disable=invalid-name
+    case_sensitive: bool
+
+    def __post_init__(self):
+        # derived from the fields, so not fields themselves
+        table, choices = _lookup(self.enum, self.by, self.case_sensitive)
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_choices", choices)
+        object.__setattr__(
+            self, "_missing", self.by != "name" and _has_custom_missing(self.enum)
+        )
+
+    def __call__(self, s: str) -> EnumType:
+        member = self._table.get(s if self.case_sensitive else s.casefold())
+        if member is not None:
+            return member
+        if self._missing:
+            try:
+                return self.enum(s)
+            except ValueError:
+                pass
+        raise ValueError(f"{s!r} is not a valid {self.enum.__name__}{self._choices}")
+
+
+def enum_transformer_factory(
+    enum: Type[EnumType],
+    by: str = "value",  # pylint: disable=invalid-name
+    case_sensitive: bool = True,
+) -> EnumTransformer[EnumType]:
+    if by not in MATCH_BY:
+        raise ValueError(f"by should be one of {MATCH_BY}, got {by!r}")
+    return EnumTransformer(enum, by, case_sensitive)
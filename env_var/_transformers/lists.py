@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from typing import (
+    AbstractSet,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Type,
+    TypeVar,
+)
+
+from ..errors import EnvVarValidationError
+from .base import DataclassTransformer
+
+T = TypeVar("T")
+
+
+class LazyItems(Iterable[T]):
+    """
+    Items of a list-valued environment variable, transformed while
+    iterating. The raw string is scanned in place, without building
+    the list of split strings; every iteration starts over, so the
+    object can be iterated several times (and safely cached).
+    """
+
+    __slots__ = ("__raw", "__split_on", "__item_transformer", "__var_name")
+
+    def __init__(
+        self,
+        raw: str,
+        split_on: str,
+        item_transformer: Callable[[str], T],
+        var_name: str,
+    ) -> None:
+        self.__raw = raw
+        self.__split_on = split_on
+        self.__item_transformer = item_transformer
+        self.__var_name = var_name
+
+    def __iter__(self) -> Iterator[T]:
+        raw, split_on, transformer = (
+            self.__raw,
+            self.__split_on,
+            self.__item_transformer,
+        )
+        step = len(split_on)
+        start = 0
+        while True:
+            end = raw.find(split_on, start)
+            item = raw[start:] if end == -1 else raw[start:end]
+            try:
+                val = transformer(item)
+            except ValueError as err:
+                # raised while iterating, outside of the accessor,
+                # so it has to be converted here
+                raise EnvVarValidationError(self.__var_name, *err.args) from None
+            yield val
+            if end == -1:
+                return
+            start = end + step
+
+    def __repr__(self) -> str:
+        return f"LazyItems({self.__raw!r}, split_on={self.__split_on!r})"
+
+
+@dataclass(frozen=True)
+class LazyListTransformer(DataclassTransformer, Generic[T]):
+    """
+    Callable wrapping the raw value in :class:`LazyItems`
+    """
+
+    __slots__ = ("item_transformer", "split_on", "var_name")
+
+    item_transformer: Callable[[str], T]
+    split_on: str
+    var_name: str
+
+    def __call__(self, s: str) -> LazyItems[T]:
+        return LazyItems(s, self.split_on, self.item_transformer, self.var_name)
+
+
+def lazy_list_transformer_factory(
+    item_transformer: Callable[[str], T], split_on: str, var_name: str
+) -> LazyListTransformer[T]:
+    if not split_on:
+        raise ValueError("empty separator")
+    return LazyListTransformer(item_transformer, split_on, var_name)
+
+
+@dataclass(frozen=True)
+class ListTransformer(DataclassTransformer, Generic[T]):
+    """
+    Callable splitting a string and transforming every item;
+    compared by value, so equal transformers share cache entries
+    """
+
+    __slots__ = ("item_transformer", "split_on")
+
+    item_transformer: Callable[[str], T]
+    split_on: str
+
+    def __call__(self, s: str) -> List[T]:
+        return [self.item_transformer(el) for el in s.split(self.split_on)]
+
+
+@dataclass(frozen=True)
+class SetTransformer(DataclassTransformer, Generic[T]):
+    """
+    Callable parsing a list into a set or a frozenset,
+    optionally rejecting duplicate items
+    """
+
+    __slots__ = ("item_transformer", "split_on", "set_type", "allow_duplicates")
+
+    item_transformer: Callable[[str], T]
+    split_on: str
+    set_type: Type[AbstractSet]
+    allow_duplicates: bool
+
+    def __call__(self, s: str) -> AbstractSet[T]:
+        items = [self.item_transformer(el) for el in s.split(self.split_on)]
+        result = self.set_type(items)
+        if not self.allow_duplicates and len(result) != len(items):
+            raise ValueError(
+                "duplicate items: " + ", ".join(map(repr, _duplicates(items)))
+            )
+        return result
+
+
+def _duplicates(items: List[T]) -> List[T]:
+    seen = set()
+    duplicates = {}
+    for item in items:
+        if item in seen:
+            duplicates[item] = None
+        seen.add(item)
+    return list(duplicates)
@@ -1,33 +1,66 @@
-from typing import Optional, Type, TypeVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar
+
+from .base import DataclassTransformer
 
 NumericType = TypeVar("NumericType", int, float)
 
 
+@dataclass(frozen=True)
+class NumTransformer(DataclassTransformer, Generic[NumericType]):
+    """
+    Callable parsing a number and checking its bounds; a class
+    rather than a closure, so :mod:`env_var._compiler` can
+    inline the checks into generated loaders
+    """
+
+    __slots__ = ("type_", "min", "max", "base")
+
+    type_: Type[NumericType]
+    min: Optional[NumericType]
+    max: Optional[NumericType]
+    base: Optional[int]
+
+    def __call__(self, s: str) -> NumericType:
+        if self.base is None:
+            val = self.type_(s)
+        else:
+            val = self.type_(s, base=self.base)  # type: ignore
+
+        if self.min is not None and val < self.min:
+            raise ValueError(f"should be bigger or equal {self.min}")
+
+        if self.max is not None and val > self.max:
+            raise ValueError(f"should be less or equal {self.max}")
+
+        return val
+
+    @classmethod
+    def _factory(cls) -> Callable[..., Any]:
+        # unpickled transformers are interned too
+        return num_transformer_factory
+
+
+# identical transformers are shared, e.g. every `as_port_number()`
+# call returns the same instance; the types of the bounds are part
+# of the key, as 1 == 1.0 but they are formatted differently in errors
+_interned: Dict[Tuple[Any, ...], NumTransformer] = {}
+
+
 def num_transformer_factory(
     type_: Type[NumericType],
     min: Optional[NumericType] = None,
     max: Optional[NumericType] = None,
     base: Optional[int] = None,
-):
+) -> NumTransformer[NumericType]:
     if min is not None and max is not None and min > max:
         raise ValueError("min should be less than max")
 
     if base is not None and type_ is float:
         raise ValueError("base can be only defined for int")
 
-    def transformer(s: str) -> NumericType:
-
-        if base is None:
-            val = type_(s)
-        else:
-            val = type_(s, base=base)  # type: ignore
-
-        if min is not None and val < min:
-            raise ValueError(f"should be bigger or equal {min}")
-
-        if max is not None and val > max:
-            raise ValueError(f"should be less or equal {max}")
-
-        return val
-
+    key = (type_, base, type(min), min, type(max), max)
+    transformer = _interned.get(key)
+    if transformer is None:
+        transformer = _interned.setdefault(key, NumTransformer(type_, min, max, base))
     return transformer
@@ -1,9 +1,10 @@
 import re
+from dataclasses import dataclass
 from typing import Pattern
 
-import validators
 from rfc3986_validator import validate_rfc3986
-from validators import ValidationFailure
+
+from .base import DataclassTransformer
 
 # kudos for the regex: https://github.com/ajv-validator/ajv-formats
 hostname_regex = re.compile(
@@ -12,34 +13,205 @@ hostname_regex = re.compile(
 )
 
 
-def regex_validator_factory(pattern: Pattern[str]):
-    def validator(s: str):
-        if re.match(pattern, s):
+@dataclass(frozen=True)
+class RegexValidator(DataclassTransformer):
+    """
+    Callable checking that strings match a pattern;
+    compared by value, so equal validators share cache entries
+    """
+
+    __slots__ = ("pattern",)
+
+    pattern: Pattern[str]
+
+    def __call__(self, s: str) -> str:
+        if self.pattern.match(s):
             return s
-        raise ValueError(f'"{s}" doesn\'t match pattern "{pattern}"')
+        raise ValueError(f'"{s}" doesn\'t match pattern "{self.pattern}"')
 
-    return validator
+
+def regex_validator_factory(pattern: Pattern[str]) -> RegexValidator:
+    return RegexValidator(pattern)
 
 
 hostname_validator = regex_validator_factory(hostname_regex)
 
 
+def hostname_normalizer(s: str):
+    # hostnames are case insensitive
+    return hostname_validator(s).lower()
+
+
 def uri_validator(s: str):
     if validate_rfc3986(s, rule="URI") is None:
         raise ValueError(f"{s} is not a valid URI")
     return s
 
 
-def use_validators_package(validator_name: str):
-    def validator(s: str):
-        validation_result = getattr(validators, validator_name)(s)
-        if isinstance(validation_result, ValidationFailure):
-            raise ValueError(f"{s} is not a valid {validator_name}")
-        return s
+# The url, email and uuid validators below accept the same strings as
+# the ones of the validators package (0.18.2, MIT) they replace. The url
+# regex of the package (https://gist.github.com/dperini/729294) takes
+# quadratic time on long invalid hosts, so urls are split into their
+# parts first, and each part is checked by a pattern matching in linear
+# time. Bound methods of the compiled patterns are kept, to skip the
+# attribute lookups on every call.
+
+_URL_FLAGS = re.IGNORECASE | re.UNICODE
+# characters of host names, IP addresses included; a host is always
+# followed by one of ":/?#", or by the end of the url
+_HOST_CHAR = r"[a-z\u00a1-\uffff\U00010000-\U0010ffff0-9]"
+_TLD_CHAR = r"[a-z\u00a1-\uffff\U00010000-\U0010ffff]"
+_IP_MIDDLE_OCTET = r"(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5]))"
+_IP_LAST_OCTET = r"(?:\.(?:0|[1-9]\d?|1\d\d|2[0-4]\d|25[0-5]))"
+_IP_OCTET = r"(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])"
+
+_match_scheme = re.compile(r"(?:https?|ftp)://", _URL_FLAGS).match
+# the password charset is a subset of this one, and neither contains "@",
+# so user info, if any, ends at the first "@"
+_fullmatch_user_info = re.compile(
+    r"[-a-z\u00a1-\uffff0-9._~%!$&'()*+,;=:]+", _URL_FLAGS
+).fullmatch
+_match_host = re.compile(
+    r"[-.a-z\u00a1-\uffff\U00010000-\U0010ffff0-9]*", _URL_FLAGS
+).match
+_fullmatch_ip_or_localhost = re.compile(
+    # private networks
+    rf"(?:10|127){_IP_MIDDLE_OCTET}{{2}}{_IP_LAST_OCTET}"
+    rf"|(?:169\.254|192\.168){_IP_MIDDLE_OCTET}{_IP_LAST_OCTET}"
+    rf"|172\.(?:1[6-9]|2\d|3[0-1]){_IP_MIDDLE_OCTET}{_IP_LAST_OCTET}"
+    r"|localhost"
+    # public IPs
+    rf"|(?:[1-9]\d?|1\d\d|2[01]\d|22[0-3]){_IP_MIDDLE_OCTET}{{2}}{_IP_LAST_OCTET}",
+    _URL_FLAGS,
+).fullmatch
+_fullmatch_ipv6 = re.compile(
+    r"\[(?:"
+    r"([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|"
+    r"([0-9a-fA-F]{1,4}:){1,7}:|"
+    r"([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|"
+    r"([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|"
+    r"([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|"
+    r"([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|"
+    r"([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|"
+    r"[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|"
+    r":((:[0-9a-fA-F]{1,4}){1,7}|:)|"
+    r"fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|"
+    rf"::(ffff(:0{{1,4}}){{0,1}}:){{0,1}}({_IP_OCTET}\.){{3,3}}{_IP_OCTET}|"
+    rf"([0-9a-fA-F]{{1,4}}:){{1,4}}:({_IP_OCTET}\.){{3,3}}{_IP_OCTET}"
+    r")\]",
+    _URL_FLAGS,
+).fullmatch
+# a double hyphen is only allowed in the "xn--" prefix, which can
+# be found anywhere in a label; unlike the package's
+# (?:xn--|x-?)*x+, there is a single way of matching any label
+_fullmatch_label = re.compile(
+    rf"{_HOST_CHAR}+(?:(?:-|(?<=xn)--){_HOST_CHAR}+)*", _URL_FLAGS
+).fullmatch
+_fullmatch_tld = re.compile(
+    rf"xn--{_HOST_CHAR}{{2,}}|{_TLD_CHAR}{{2,}}", _URL_FLAGS
+).fullmatch
+# port, path, query and fragment
+_match_url_tail = re.compile(
+    r"(?::\d{2,5})?"
+    r"(?:/[-a-z\u00a1-\uffff\U00010000-\U0010ffff0-9._~%!$&'()*+,;=:@/]*)?"
+    r"(?:\?\S*)?(?:#\S*)?$",
+    _URL_FLAGS,
+).match
+
+
+def _is_domain(host: str) -> bool:
+    *labels, tld = host.split(".")
+    if not labels or _fullmatch_tld(tld) is None:
+        return False
+    for label in labels:
+        if _fullmatch_label(label) is None:
+            return False
+    return True
+
+
+def _is_url(s: str) -> bool:
+    scheme = _match_scheme(s)
+    if scheme is None:
+        return False
+    start = scheme.end()
+    at = s.find("@", start)
+    if at > start and _fullmatch_user_info(s, start, at) is not None:
+        start = at + 1
+
+    if s.startswith("[", start):
+        end = s.find("]", start) + 1
+        if not end or _fullmatch_ipv6(s, start, end) is None:
+            return False
+    else:
+        end = _match_host(s, start).end()  # type: ignore
+        host = s[start:end]
+        if _fullmatch_ip_or_localhost(host) is None and not _is_domain(host):
+            return False
+    return _match_url_tail(s, end) is not None
+
+
+def url_validator(s: str):
+    if not _is_url(s):
+        raise ValueError(f"{s} is not a valid url")
+    return s
+
+
+# https://github.com/django/django/blob/master/django/core/validators.py
+_match_email_user = re.compile(
+    # dot-atom
+    r"(^[-!#$%&'*+/=?^_`{}|~0-9A-Z]+" r"(\.[-!#$%&'*+/=?^_`{}|~0-9A-Z]+)*$"
+    # quoted-string
+    r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]|'
+    r"""\\[\001-\011\013\014\016-\177])*"$)""",
+    re.IGNORECASE,
+).match
+_match_email_domain = re.compile(
+    # domain
+    r"(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+"
+    r"(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?$)"
+    # literal form, ipv4 address (SMTP 4.1.3)
+    r"|^\[(25[0-5]|2[0-4]\d|[0-1]?\d?\d)" r"(\.(25[0-5]|2[0-4]\d|[0-1]?\d?\d)){3}\]$",
+    re.IGNORECASE,
+).match
+
+
+def _is_email(s: str) -> bool:
+    user, at, domain = s.rpartition("@")
+    if not at or _match_email_user(user) is None:
+        return False
+    if len(user.encode("utf-8")) > 64:
+        return False
+    if domain == "localhost" or _match_email_domain(domain) is not None:
+        return True
+    try:
+        # internationalized domain names
+        domain = domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return False
+    return _match_email_domain(domain) is not None
 
-    return validator
+
+def email_validator(s: str):
+    if not _is_email(s):
+        raise ValueError(f"{s} is not a valid email")
+    return s
 
 
-url_validator = use_validators_package("url")
-email_validator = use_validators_package("email")
-uuid_validator = use_validators_package("uuid")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def uuid_validator(s: str):
+    # the package's regex ends with "$", which also matches before a final "\n"
+    val = s[:-1] if s[-1:] == "\n" else s
+    if (
+        len(val) != 36
+        or val[8] != "-"
+        or val[13] != "-"
+        or val[18] != "-"
+        or val[23] != "-"
+        or not _HEX_DIGITS.issuperset(
+            val[:8] + val[9:13] + val[14:18] + val[19:23] + val[24:]
+        )
+    ):
+        raise ValueError(f"{s} is not a valid uuid")
+    return s
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, NamedTuple, Tuple
+
+CacheKey = Tuple[str, str, Callable[[str], Any]]
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a :class:`ParseCache`, modelled
+    after :func:`functools.lru_cache`'s ``cache_info``
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_MISSING = object()
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parsed environment variables.
+
+    Entries are keyed on the variable name, its raw string value
+    and the transformer used, so a changed environment variable
+    is simply a cache miss. Transformers of the built-in accessors
+    are compared by value; custom transformers are compared as
+    they are, so e.g. a lambda created on every call never hits.
+    Note that cached values are shared between calls, so mutable
+    results (e.g. lists) shouldn't be modified in place.
+
+    :param maxsize: max number of entries kept in the cache
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize should be bigger or equal 1")
+        self.__maxsize = maxsize
+        self.__data: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self.__lock = Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_or_parse(self, key: CacheKey) -> Any:
+        """
+        :param key: tuple of the variable name, its raw value
+            and the transformer to call on cache miss
+
+        :returns: cached result or freshly parsed value
+
+        :raises ValueError: whatever the transformer raises,
+            failures are never cached
+        """
+        with self.__lock:
+            val = self.__data.get(key, _MISSING)
+            if val is not _MISSING:
+                self.__data.move_to_end(key)
+                self.__hits += 1
+                return val
+            self.__misses += 1
+
+        _, raw, transformer = key
+        val = transformer(raw)
+
+        with self.__lock:
+            self.__data[key] = val
+            self.__data.move_to_end(key)
+            if len(self.__data) > self.__maxsize:
+                self.__data.popitem(last=False)
+        return val
+
+    @property
+    def hits(self) -> int:
+        """number of lookups answered from the cache"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """number of lookups that called the transformer"""
+        return self.__misses
+
+    def info(self) -> CacheInfo:
+        """
+        :returns: hit/miss counters and the current size of the cache
+        """
+        with self.__lock:
+            return CacheInfo(
+                self.__hits, self.__misses, self.__maxsize, len(self.__data)
+            )
+
+    def clear(self) -> None:
+        """
+        Drops all cached entries and resets the counters
+        """
+        with self.__lock:
+            self.__data.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+
+default_cache = ParseCache()
+"""cache used by :meth:`~env_var.env._env.cached` when none is given"""
@@ -1,29 +1,41 @@
+# transformers depending on third-party packages (dateutil, isoduration,
+# validators...) are imported inside the methods using them, so that
+# `import env_var` stays cheap for code that never needs them
+# pylint: disable=import-outside-toplevel
 from __future__ import annotations
 
 import ipaddress
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass
 from enum import Enum
-from typing import Callable, Generic, List, Optional, Pattern, Type, TypeVar, Union
+from time import perf_counter_ns
+from typing import (
+    Callable,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urlparse
 
-from ._transformers.date import (
-    datetime_transformer,
-    iso_date_validator,
-    iso_datetime_transformer,
-    iso_duration_transformer,
-)
+from ._sources.files import read_value_cached
+from ._transformers.enums import enum_transformer_factory
 from ._transformers.numeric import num_transformer_factory
-from ._transformers.string_validators import (
-    email_validator,
-    hostname_validator,
-    regex_validator_factory,
-    uri_validator,
-    url_validator,
-    uuid_validator,
-)
+from .cache import ParseCache, default_cache
 from .errors import EnvVarNotDefinedError, EnvVarValidationError
+from .instrumentation import ResolutionEvent, _hooks, emit, transformer_name
+from .networks import NetworkSet, NetworkSetTransformer
+from .patterns import PatternSet, PatternSetTransformer
+from .result import EnvResult
 
 
 # as the whole distutils package is deprecated in python 3.10,
@@ -43,6 +55,13 @@ def strtobool(val):
     raise ValueError(f"invalid truth value {val}")
 
 
+# unlike a lambda, it's the same object for every accessor,
+# so parse caches keyed on the transformer can hit
+def identity(val: str) -> str:
+    """Return the string unchanged."""
+    return val
+
+
 T = TypeVar("T")
 
 EnumType = TypeVar("EnumType", bound=Enum)  # pylint: disable=invalid-name
@@ -53,12 +72,17 @@ class env:  # pylint: disable=invalid-name,too-many-public-methods
     """
     Utility to validate and type cast environment variables.
     All methods return an instance of the :class:`~env._env` class.
+
+    :param var_name: name of the environment variable
+    :param source: mapping to read the variable from instead of
+        :data:`os.environ`, e.g. one of :mod:`env_var.sources`
     """
 
     var_name: str
+    source: Optional[Mapping[str, str]] = None
 
     def __ret_env(self, transformer: Callable[[str], T]) -> _env[T]:
-        return _env[T](self.var_name, transformer)
+        return _env(self.var_name, transformer, self.source)
 
     def as_int(
         self,
@@ -146,62 +170,113 @@ class env:  # pylint: disable=invalid-name,too-many-public-methods
         """
         return self.__ret_env(ipaddress.ip_network)
 
+    def as_ip_network_list(
+        self, split_on: str = ",", strict: bool = True
+    ) -> _env[NetworkSet]:
+        """
+        Parses env var as a list of networks, using
+        :func:`ipaddress.ip_network`, into a
+        :class:`~env_var.networks.NetworkSet`, checking
+        address membership in logarithmic time
+
+        :param split_on: string on which env var should be split
+        :param strict: if False, networks with host bits set are allowed
+        """
+        return self.__ret_env(NetworkSetTransformer(split_on, strict))
+
     def as_ip_interface(self):
         """
         Parses env var using :func:`ipaddress.ip_interface`
         """
         return self.__ret_env(ipaddress.ip_interface)
 
-    def as_enum(self, enum: Type[EnumType]) -> _env[EnumType]:
+    def as_enum(
+        self,
+        enum: Type[EnumType],
+        by: str = "value",  # pylint: disable=invalid-name
+        case_sensitive: bool = True,
+    ) -> _env[EnumType]:
         """
-        Parses env var as an Enum
+        Parses env var as an Enum, with a lookup table built once per enum
+
+        :param enum: the Enum class
+        :param by: match member values (like ``enum(value)``, ``_missing_``
+            included), names, or "both", values taking precedence
+        :param case_sensitive: if False, matching ignores case
+
+        :raises ValueError: if ``by`` isn't one of "value", "name" or "both",
+            or if members can't be told apart when ignoring case
         """
-        return self.__ret_env(enum)
+        return self.__ret_env(enum_transformer_factory(enum, by, case_sensitive))
 
     def as_string(self):
         """
         Literally does nothing with the env var
         """
-        return self.__ret_env(lambda s: s)
+        return self.__ret_env(identity)
 
     def as_email(self):
         """
         Makes sure env var is a valid email string
         """
+        from ._transformers.string_validators import email_validator
+
         return self.__ret_env(email_validator)
 
     def as_uri(self):
         """
         Makes sure env var is a valid uri string
         """
+        from ._transformers.string_validators import uri_validator
+
         return self.__ret_env(uri_validator)
 
     def as_uuid(self):
         """
         Makes sure env var is a valid uuid string
         """
+        from ._transformers.string_validators import uuid_validator
+
         return self.__ret_env(uuid_validator)
 
     def as_url(self):
         """
         Makes sure env var is a valid url string
         """
+        from ._transformers.string_validators import url_validator
+
         return self.__ret_env(url_validator)
 
     def as_hostname(self):
         """
         Makes sure env var is a valid hostname string
         """
+        from ._transformers.string_validators import hostname_validator
+
         return self.__ret_env(hostname_validator)
 
     def should_match(self, pattern: Union[Pattern[str], str]):
         """
         Makes sure env var is matching given pattern
         """
+        from ._transformers.string_validators import regex_validator_factory
+
         if isinstance(pattern, str):
             pattern = re.compile(pattern)
         return self.__ret_env(regex_validator_factory(pattern))
 
+    def as_pattern_list(self, split_on: str = ",", flags: int = 0) -> _env[PatternSet]:
+        """
+        Parses env var as a list of regular expressions, combined into
+        a :class:`~env_var.patterns.PatternSet` matching an input
+        against all of them in a single scan
+
+        :param split_on: string on which env var should be split;
+                mind that patterns may contain commas, e.g. ``a{1,3}``
+        :param flags: flags to compile the patterns with, e.g. :data:`re.I`
+        """
+        return self.__ret_env(PatternSetTransformer(split_on, flags))
+
     def custom_transformer(self, transformer: Callable[[str], T]) -> _env[T]:
         """
         Parse/validate env var using custom transformer
@@ -212,24 +287,45 @@ class env:  # pylint: disable=invalid-name,too-many-public-methods
         """
         Parses env var using :func:`dateutil.parser.isoparse`
         """
+        from ._transformers.date import iso_datetime_transformer
+
         return self.__ret_env(iso_datetime_transformer)
 
     def as_date(self):
         """
         Parses env var using :func:`dateutil.parser.parse`
         """
+        from ._transformers.date import datetime_transformer
+
         return self.__ret_env(datetime_transformer)
 
     def as_iso_duration(self):
         """
         Parses env var using :func:`isoduration.parse_duration`
         """
+        from ._transformers.date import iso_duration_transformer
+
         return self.__ret_env(iso_duration_transformer)
 
+    def as_iso_timedelta(self):
+        """
+        Parses env var as an ISO 8601 duration into a
+        :class:`datetime.timedelta`, without :mod:`isoduration`,
+        as long as the duration has a fixed length (weeks, days,
+        hours, minutes, seconds). Durations with years or months
+        (and other forms) are parsed with
+        :func:`isoduration.parse_duration`, like :meth:`as_iso_duration`.
+        """
+        from ._transformers.date import iso_timedelta_transformer
+
+        return self.__ret_env(iso_timedelta_transformer)
+
     def as_iso_date_string(self):
         """
         Makes sure env var is as a valid rfc3339 string
         """
+        from ._transformers.date import iso_date_validator
+
         return self.__ret_env(iso_date_validator)
 
     def as_list(
@@ -242,8 +338,86 @@ class env:  # pylint: disable=invalid-name,too-many-public-methods
                 of the split string
         :param split_on: string on which env var should be split
         """
+        from ._transformers.lists import ListTransformer
+
+        return self.__ret_env(ListTransformer(item_transformer, split_on))
+
+    def as_set(
+        self,
+        item_transformer: Callable[[str], T],
+        split_on: str = ",",
+        allow_duplicates: bool = False,
+    ) -> _env[Set[T]]:
+        """
+        Parses env var as a set, e.g. an allow-list checked often
+
+        :param item_transformer: function called with every value
+                of the split string
+        :param split_on: string on which env var should be split
+        :param allow_duplicates: if False, a value containing the same
+                item (after transforming) more than once is invalid
+        """
+        from ._transformers.lists import SetTransformer
+
         return self.__ret_env(
-            lambda s: [item_transformer(el) for el in s.split(split_on)]
+            SetTransformer(item_transformer, split_on, set, allow_duplicates)
+        )
+
+    def as_frozenset(
+        self,
+        item_transformer: Callable[[str], T],
+        split_on: str = ",",
+        allow_duplicates: bool = False,
+    ) -> _env[FrozenSet[T]]:
+        """
+        Parses env var as a frozenset, see :meth:`as_set`
+
+        :param item_transformer: function called with every value
+                of the split string
+        :param split_on: string on which env var should be split
+        :param allow_duplicates: if False, a value containing the same
+                item (after transforming) more than once is invalid
+        """
+        from ._transformers.lists import SetTransformer
+
+        return self.__ret_env(
+            SetTransformer(item_transformer, split_on, frozenset, allow_duplicates)
+        )
+
+    def as_hostname_set(
+        self, split_on: str = ",", allow_duplicates: bool = False
+    ) -> _env[FrozenSet[str]]:
+        """
+        Parses env var as a frozenset of valid hostnames, lowercased
+
+        :param split_on: string on which env var should be split
+        :param allow_duplicates: if False, a value containing the same
+                hostname more than once, in any case, is invalid
+        """
+        from ._transformers.string_validators import hostname_normalizer
+
+        return self.as_frozenset(hostname_normalizer, split_on, allow_duplicates)
+
+    def as_list_iter(
+        self, item_transformer: Callable[[str], T], split_on: str = ","
+    ) -> _env[Iterable[T]]:
+        """
+        Parses env var as a list lazily: the returned iterable scans
+        the raw string in place and transforms items one at a time,
+        while being iterated. It can be iterated several times, every
+        iteration transforming the items again.
+
+        Note, invalid items are found only while iterating, and raise
+        :class:`~env_var.errors.EnvVarValidationError` from there.
+
+        :param item_transformer: function called with every value
+                of the split string
+        :param split_on: string on which env var should be split
+        """
+        from ._transformers.lists import lazy_list_transformer_factory
+
+        return self.__ret_env(
+            lazy_list_transformer_factory(item_transformer, split_on, self.var_name)
         )
 
     def as_int_list(
@@ -286,6 +460,56 @@ class env:  # pylint: disable=invalid-name,too-many-public-methods
             split_on,
         )
 
+    def as_int_array(
+        self,
+        split_on: str = ",",
+        base: Optional[int] = 10,
+        min_item_value: Optional[int] = None,
+        max_item_value: Optional[int] = None,
+    ):
+        """
+        Parses env var as an array of 64-bit ints: a
+        :class:`numpy.ndarray` if numpy is installed (``env_var[numpy]``
+        extra), otherwise an :class:`array.array`. Much faster than
+        :meth:`as_int_list` for long lists.
+
+        :param split_on: string on which env var should be split
+        :param base: the base defaults to 10; valid bases are 0 and 2-36
+        :param min_item_value: min acceptable value for a single array item
+        :param max_item_value: max acceptable value for a single array item
+        """
+        from ._transformers.arrays import array_transformer_factory
+
+        return self.__ret_env(
+            array_transformer_factory(
+                int, split_on, min=min_item_value, max=max_item_value, base=base
+            )
+        )
+
+    def as_float_array(
+        self,
+        split_on: str = ",",
+        min_item_value: Optional[float] = None,
+        max_item_value: Optional[float] = None,
+    ):
+        """
+        Parses env var as an array of floats: a :class:`numpy.ndarray`
+        if numpy is installed (``env_var[numpy]`` extra), otherwise
+        an :class:`array.array`. Much faster than :meth:`as_float_list`
+        for long lists.
+
+        :param split_on: string on which env var should be split
+        :param min_item_value: min acceptable value for a single array item
+        :param max_item_value: max acceptable value for a single array item
+        """
+        from ._transformers.arrays import array_transformer_factory
+
+        return self.__ret_env(
+            array_transformer_factory(
+                float, split_on, min=min_item_value, max=max_item_value
+            )
+        )
+
     def as_string_list(
         self,
         split_on: str = ",",
@@ -295,21 +519,60 @@ class env:  # pylint: disable=invalid-name,too-many-public-methods
 
         :param split_on: string on which env var should be split
         """
-        return self.as_list(lambda s: s, split_on)
+        return self.as_list(identity, split_on)
 
 
-@dataclass
 class _env(Generic[T]):
     """
     Helper generic class that is actually returned
     by all methods of the :class:`env` class. It's not
     supposed to be instantiated directly by the user
     of the library.
+
+    Instances are immutable and hashable, so an accessor can be
+    declared once, e.g. at module level, and reused:
+
+    .. code-block:: python
+
+        MAX_CONN = env("MAX_CONN").as_int(min=1)
+
+        def connect():
+            max_conn = MAX_CONN.required()
     """
 
-    __var_name: str
-    __transformer: Callable[[str], T]
-    __default: Optional[T] = None
+    __slots__ = (
+        "_var_name",
+        "_transformer",
+        "_source",
+        "_default",
+        "_cache",
+        "_file_suffix",
+    )
+
+    # set once in __init__, __setattr__ is disabled
+    _var_name: str
+    _transformer: Callable[[str], T]
+    _source: Optional[Mapping[str, str]]
+    _default: Optional[T]
+    _cache: Optional[ParseCache]
+    _file_suffix: Optional[str]
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        var_name: str,
+        transformer: Callable[[str], T],
+        source: Optional[Mapping[str, str]] = None,
+        default: Optional[T] = None,
+        cache: Optional[ParseCache] = None,
+        file_suffix: Optional[str] = None,
+    ) -> None:
+        setattr_ = object.__setattr__
+        setattr_(self, "_var_name", var_name)
+        setattr_(self, "_transformer", transformer)
+        setattr_(self, "_source", source)
+        setattr_(self, "_default", default)
+        setattr_(self, "_cache", cache)
+        setattr_(self, "_file_suffix", file_suffix)
 
     def required(self) -> T:
         """
@@ -320,7 +583,7 @@ class _env(Generic[T]):
         """
         val = self.__getenv()
         if val is None:
-            raise EnvVarNotDefinedError(self.__var_name)
+            raise EnvVarNotDefinedError(self._var_name)
         return val
 
     def optional(self) -> Optional[T]:
@@ -332,7 +595,25 @@ class _env(Generic[T]):
         """
         return self.__getenv()
 
-    def default(self, val: T):
+    def try_required(self) -> EnvResult[T]:
+        """
+        Like :meth:`required`, but returns failures instead of raising
+
+        :returns: result holding the parsed environment variable,
+            or the lazily created error
+        """
+        return self.__try(True)
+
+    def try_optional(self) -> EnvResult[Optional[T]]:
+        """
+        Like :meth:`optional`, but returns failures instead of raising
+
+        :returns: result holding the parsed environment variable,
+            the default value or None, or the lazily created error
+        """
+        return self.__try(False)
+
+    def default(self, val: T) -> _env[T]:
         """
         Sets the default value to return in case
         the environment variable is not defined.
@@ -342,16 +623,244 @@ class _env(Generic[T]):
 
         :param val: default value to use
 
-        :returns: self
+        :returns: a copy of the accessor with the default set;
+            the accessor itself is not modified
         """
-        self.__default = val
-        return self
+        return self.__replace(default=val)
 
-    def __getenv(self) -> Optional[T]:
-        val = os.getenv(self.__var_name)  # pylint: disable=invalid-envvar-value
+    def cached(self, cache: Optional[ParseCache] = None) -> _env[T]:
+        """
+        Enables caching of the parsed value, so the transformer
+        is called again only when the raw value of the environment
+        variable changes.
+
+        :param cache: cache to use; if not given, the module level
+            :data:`~env_var.cache.default_cache` is used
+
+        :returns: a copy of the accessor using the cache
+        """
+        return self.__replace(cache=default_cache if cache is None else cache)
+
+    @property
+    def var_name(self) -> str:
+        """
+        name of the environment variable
+        """
+        return self._var_name
+
+    def allow_file(self, suffix: str = "_FILE") -> _env[T]:
+        """
+        Allows reading the value from a file, whose path is set in
+        a variable named after this one with the ``suffix`` appended,
+        e.g. ``DB_PASSWORD_FILE=/run/secrets/db_password``, as done
+        with Docker secrets. Used only when the variable itself is not
+        set. Trailing newlines are stripped; the contents are cached
+        until the file's mtime, size or inode changes.
+
+        :param suffix: suffix of the variable holding the path
+
+        :returns: a copy of the accessor reading the file
+        """
+        return self.__replace(file_suffix=suffix)
+
+    def __replace(self, **changes) -> _env[T]:
+        kwargs = dict(
+            zip(
+                (
+                    "var_name",
+                    "transformer",
+                    "source",
+                    "default",
+                    "cache",
+                    "file_suffix",
+                ),
+                self._components(),
+            )
+        )
+        kwargs.update(changes)
+        return _env(**kwargs)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self):
+        return _env, self._components()
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not _env:
+            return NotImplemented
+        # sources and caches are mutable, so compared by identity
+        var_name, transformer, source, default, cache, file_suffix = self._components()
+        other_components = other._components()  # type: ignore
+        return (
+            var_name == other_components[0]
+            and transformer == other_components[1]
+            and source is other_components[2]
+            and default == other_components[3]
+            and cache is other_components[4]
+            and file_suffix == other_components[5]
+        )
+
+    def __hash__(self) -> int:
+        # the default may be unhashable, e.g. a list
+        return hash(
+            (
+                self._var_name,
+                self._transformer,
+                id(self._source),
+                id(self._cache),
+                self._file_suffix,
+            )
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"_env(var_name={self._var_name!r}, "
+            f"transformer={transformer_name(self._transformer)}, "
+            f"source={self._source!r}, default={self._default!r}, "
+            f"cache={self._cache!r}, file_suffix={self._file_suffix!r})"
+        )
+
+    def _components(
+        self,
+    ) -> Tuple[
+        str,
+        Callable[[str], T],
+        Optional[Mapping[str, str]],
+        Optional[T],
+        Optional[ParseCache],
+        Optional[str],
+    ]:
+        """
+        Parts of the accessor needed by :mod:`env_var._compiler`
+        """
+        return (
+            self._var_name,
+            self._transformer,
+            self._source,
+            self._default,
+            self._cache,
+            self._file_suffix,
+        )
+
+    def _raw(self, environ: Optional[Mapping[str, str]] = None) -> Optional[str]:
+        """
+        Looks up the raw value in the accessor's source if it has one,
+        else in ``environ``, else in the environment.
+        """
+        source = environ if self._source is None else self._source
+        if source is None:
+            source = os.environ
+        val = source.get(self._var_name)
+        if val is not None or self._file_suffix is None:
+            return val
+
+        file_var_name = self._var_name + self._file_suffix
+        path = source.get(file_var_name)
+        if path is None:
+            return None
+        try:
+            return read_value_cached(path)
+        except (OSError, UnicodeDecodeError) as err:
+            raise EnvVarValidationError(
+                self._var_name, f'can\'t read file set in "{file_var_name}": {err}'
+            ) from None
+
+    def _parse(self, val: Optional[str]) -> Optional[T]:
+        """
+        Transforms a raw value looked up elsewhere (e.g. by
+        :class:`~env_var.schema.EnvSchema`), the same way
+        the value read from the environment would be.
+        """
         if val is None:
-            return self.__default
+            return self._default
         try:
-            return self.__transformer(val)
+            if self._cache is not None:
+                return self._cache.get_or_parse(
+                    (self._var_name, val, self._transformer)
+                )
+            return self._transformer(val)
         except ValueError as err:
-            raise EnvVarValidationError(self.__var_name, *err.args) from None
+            raise EnvVarValidationError(self._var_name, *err.args) from None
+
+    def __getenv(self) -> Optional[T]:
+        if _hooks:
+            return self._getenv_instrumented()
+        # the common case of _raw inlined
+        source = self._source
+        val = (os.environ if source is None else source).get(self._var_name)
+        if val is None and self._file_suffix is not None:
+            val = self._raw()
+        return self._parse(val)
+
+    def __try(self, required: bool) -> EnvResult:
+        # no EnvVarValidationError is created on the common failure path,
+        # only the arguments of the transformer's ValueError are kept
+        try:
+            if _hooks:
+                val = self._getenv_instrumented()
+            else:
+                raw = self._raw()
+                if raw is None:
+                    val = self._default
+                else:
+                    try:
+                        if self._cache is not None:
+                            val = self._cache.get_or_parse(
+                                (self._var_name, raw, self._transformer)
+                            )
+                        else:
+                            val = self._transformer(raw)
+                    except ValueError as err:
+                        return EnvResult(self._var_name, reason=err.args)
+        except EnvVarValidationError as err:
+            return EnvResult(self._var_name, reason=err.with_traceback(None))
+        if val is None and required:
+            return EnvResult.not_defined(self._var_name)
+        return EnvResult(self._var_name, val)
+
+    def _getenv_instrumented(
+        self, environ: Optional[Mapping[str, str]] = None
+    ) -> Optional[T]:
+        """
+        Like ``self._parse(self._raw(environ))``, emitting
+        a :class:`~env_var.instrumentation.ResolutionEvent`
+        """
+        start = perf_counter_ns()
+        raw = None
+        outcome = "error"
+        try:
+            raw = self._raw(environ)
+            val = self._parse(raw)
+            if raw is not None:
+                outcome = "ok"
+            else:
+                outcome = "missing" if val is None else "default"
+            return val
+        except EnvVarValidationError:
+            outcome = "invalid"
+            raise
+        finally:
+            elapsed_ns = perf_counter_ns() - start
+            source = self._source
+            if source is None and environ is not os.environ:
+                source = environ
+            source_name = "os.environ" if source is None else type(source).__name__
+            if raw is not None and self._file_suffix is not None:
+                if (os.environ if source is None else source).get(
+                    self._var_name
+                ) is None:
+                    source_name = "file"
+            emit(
+                ResolutionEvent(
+                    self._var_name,
+                    source_name,
+                    None if raw is None else len(raw),
+                    transformer_name(self._transformer),
+                    elapsed_ns,
+                    outcome,
+                )
+            )
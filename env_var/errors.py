@@ -1,3 +1,6 @@
+from typing import List
+
+
 class EnvVarNotDefinedError(Exception):
     """
     Exception raised when env var is not set
@@ -21,3 +24,15 @@ class EnvVarValidationError(Exception):
                 filter(None, [f'error while validating env var "{var_name}"', msg])
             )
         )
+
+
+class EnvSchemaError(Exception):
+    """
+    Exception raised when at least one env var of a schema
+    is not defined or not valid; all the underlying errors
+    are available as :attr:`errors`
+    """
+
+    def __init__(self, errors: List[Exception]) -> None:
+        self.errors = errors
+        super().__init__("\n".join(str(err) for err in errors))
@@ -0,0 +1,88 @@
+"""
+Hooks called on every :meth:`~env_var.env._env.required` and
+:meth:`~env_var.env._env.optional` call, e.g. to find variables read
+in hot loops or slow transformers:
+
+.. code-block:: python
+
+    from env_var import instrumentation
+
+    def log_slow(event: instrumentation.ResolutionEvent):
+        if event.elapsed_ns > 100_000:
+            logger.warning("slow env var %s", event.var_name)
+
+    instrumentation.add_hook(log_slow)
+
+:meth:`~env_var.schema.EnvSchema.load` and compiled schema loaders
+emit an event per field too. Values taken from the file of
+:meth:`~env_var.schema.EnvSchema.load_cached` or from a snapshot aren't
+resolved again, so they don't emit any event.
+
+When no hook is registered, accessors skip the instrumentation
+entirely, apart from checking if the list of hooks is empty.
+"""
+
+from typing import Callable, List, NamedTuple, Optional
+
+
+class ResolutionEvent(NamedTuple):
+    """
+    Details of a single resolution of an environment variable
+    """
+
+    var_name: str
+    """name of the environment variable"""
+    source: str
+    """where the raw value was looked up: ``os.environ``, class name of
+    the source passed to :class:`~env_var.env`, or ``file``, when read
+    from the file set in the ``_FILE`` variable"""
+    raw_length: Optional[int]
+    """length of the raw value, None if not set"""
+    transformer: str
+    """name of the transformer"""
+    elapsed_ns: int
+    """time spent looking up and transforming the value"""
+    outcome: str
+    """``ok``, ``default`` (not set, default used), ``missing``
+    (not set, no default), ``invalid`` (validation failed)
+    or ``error`` (the transformer raised an unexpected exception)"""
+
+
+Hook = Callable[[ResolutionEvent], None]
+
+_hooks: List[Hook] = []
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Registers a function called with a :class:`ResolutionEvent`
+    after each resolution; exceptions it raises are propagated
+    to the caller of ``required``/``optional``
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """
+    :raises ValueError: if the hook is not registered
+    """
+    _hooks.remove(hook)
+
+
+def transformer_name(transformer: Callable) -> str:
+    """
+    :returns: qualified name of the transformer, or of its class
+        for callable instances
+    """
+    name = getattr(transformer, "__qualname__", None)
+    if name is None:
+        name = type(transformer).__qualname__
+    return name
+
+
+def emit(event: ResolutionEvent) -> None:
+    """
+    Calls the registered hooks with the event
+    """
+    for hook in tuple(_hooks):
+        hook(event)
@@ -0,0 +1,192 @@
+"""
+Counters of environment variable lookups, built on top of
+:mod:`env_var.instrumentation`, with a Prometheus text format exporter:
+
+.. code-block:: python
+
+    from env_var import metrics
+
+    metrics.registry.install()
+
+    # e.g. in the handler of the /metrics endpoint
+    body = metrics.registry.to_prometheus()
+
+Nothing is counted until the registry is installed. Only resolutions
+emitting events are counted, see :mod:`env_var.instrumentation`; values
+reused by :meth:`~env_var.schema.EnvSchema.load_cached` aren't.
+"""
+
+from threading import Lock
+from typing import Dict, List, NamedTuple
+
+from . import instrumentation
+from .cache import CacheInfo, ParseCache, default_cache
+from .instrumentation import ResolutionEvent
+
+
+class VariableMetrics(NamedTuple):
+    """
+    Counters of a single environment variable
+    """
+
+    lookups: int
+    validation_failures: int
+    default_fallbacks: int
+    missing: int
+
+
+class MetricsSnapshot(NamedTuple):
+    """
+    Point in time copy of the counters of a :class:`MetricsRegistry`
+    """
+
+    variables: Dict[str, VariableMetrics]
+    caches: Dict[str, CacheInfo]
+
+
+def hit_ratio(info: CacheInfo) -> float:
+    """
+    :returns: ratio of cache hits to all cache lookups, 0 if there were none
+    """
+    total = info.hits + info.misses
+    return info.hits / total if total else 0.0
+
+
+def _escape_label(val: str) -> str:
+    return val.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """
+    Collects per-variable counters from resolution events and
+    statistics of the tracked :class:`~env_var.cache.ParseCache`
+    instances
+    """
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__counters: Dict[str, List[int]] = {}
+        self.__caches: Dict[str, ParseCache] = {}
+
+    def install(self) -> "MetricsRegistry":
+        """
+        Starts counting, by registering :meth:`record`
+        as an :mod:`~env_var.instrumentation` hook
+
+        :returns: self
+        """
+        instrumentation.add_hook(self.record)
+        return self
+
+    def uninstall(self) -> None:
+        """
+        Stops counting, keeping the counters
+        """
+        instrumentation.remove_hook(self.record)
+
+    def track_cache(self, name: str, cache: ParseCache) -> None:
+        """
+        Includes statistics of a cache in snapshots and exports
+
+        :param name: value of the ``cache`` label
+        :param cache: cache to track
+        """
+        with self.__lock:
+            self.__caches[name] = cache
+
+    def record(self, event: ResolutionEvent) -> None:
+        """
+        Updates the counters of the variable from the event
+        """
+        with self.__lock:
+            counters = self.__counters.get(event.var_name)
+            if counters is None:
+                counters = self.__counters[event.var_name] = [0, 0, 0, 0]
+            counters[0] += 1
+            if event.outcome in ("invalid", "error"):
+                counters[1] += 1
+            elif event.outcome == "default":
+                counters[2] += 1
+            elif event.outcome == "missing":
+                counters[3] += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        :returns: copy of all the counters
+        """
+        with self.__lock:
+            variables = {
+                name: VariableMetrics(*counters)
+                for name, counters in self.__counters.items()
+            }
+            caches = dict(self.__caches)
+        return MetricsSnapshot(
+            variables, {name: cache.info() for name, cache in caches.items()}
+        )
+
+    def reset(self) -> None:
+        """
+        Clears the per-variable counters; cache statistics
+        are reset with :meth:`~env_var.cache.ParseCache.clear`
+        """
+        with self.__lock:
+            self.__counters.clear()
+
+    def to_prometheus(self, prefix: str = "env_var") -> str:
+        """
+        :param prefix: prefix of the metric names
+
+        :returns: all the metrics in the Prometheus text exposition format
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def metric(name: str, type_: str, help_: str, label: str, values):
+            lines.append(f"# HELP {prefix}_{name} {help_}")
+            lines.append(f"# TYPE {prefix}_{name} {type_}")
+            for label_value, val in values:
+                lines.append(
+                    f'{prefix}_{name}{{{label}="{_escape_label(label_value)}"}} {val}'
+                )
+
+        variables = sorted(snapshot.variables.items())
+        for field, help_ in (
+            ("lookups", "Number of times an environment variable was resolved."),
+            ("validation_failures", "Number of failed validations."),
+            ("default_fallbacks", "Number of times the default value was used."),
+            ("missing", "Number of lookups of unset variables without default."),
+        ):
+            metric(
+                f"{field}_total",
+                "counter",
+                help_,
+                "var",
+                ((name, getattr(counters, field)) for name, counters in variables),
+            )
+
+        caches = sorted(snapshot.caches.items())
+        for name, type_, help_, getter in (
+            ("cache_hits_total", "counter", "Number of cache hits.", lambda i: i.hits),
+            (
+                "cache_misses_total",
+                "counter",
+                "Number of cache misses.",
+                lambda i: i.misses,
+            ),
+            ("cache_size", "gauge", "Number of cached entries.", lambda i: i.currsize),
+            ("cache_hit_ratio", "gauge", "Ratio of cache hits.", hit_ratio),
+        ):
+            metric(
+                name,
+                type_,
+                help_,
+                "cache",
+                ((cache, getter(info)) for cache, info in caches),
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+"""default registry, tracking :data:`~env_var.cache.default_cache`"""
+registry.track_cache("default", default_cache)
@@ -0,0 +1,123 @@
+"""
+Index of IP networks, returned by
+:meth:`~env_var.env.as_ip_network_list`, answering whether an
+address belongs to any of the networks in logarithmic time:
+
+.. code-block:: python
+
+    TRUSTED = env("TRUSTED_NETWORKS").as_ip_network_list().required()
+
+    def handle(request):
+        if request.remote_addr not in TRUSTED:
+            ...
+"""
+
+import ipaddress
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from ._transformers.base import DataclassTransformer
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def _intervals(networks: Iterable[IPNetwork]) -> Tuple[List[int], List[int]]:
+    starts: List[int] = []
+    ends: List[int] = []
+    for network in networks:
+        start = int(network.network_address)
+        end = int(network.broadcast_address)
+        # collapse_addresses leaves adjacent networks that can't
+        # form a single CIDR (e.g. .1.0/24 and .2.0/24) separate
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class NetworkSet:
+    """
+    Set of IPv4 and IPv6 networks. Overlapping and adjacent networks
+    are collapsed, and kept as sorted lists of integer intervals per
+    IP version, so membership is a binary search.
+
+    :param networks: networks to include
+    """
+
+    __slots__ = ("networks", "__v4", "__v6")
+
+    def __init__(self, networks: Iterable[IPNetwork]) -> None:
+        ipv4_networks: List[ipaddress.IPv4Network] = []
+        ipv6_networks: List[ipaddress.IPv6Network] = []
+        for network in networks:
+            by_version = ipv4_networks if network.version == 4 else ipv6_networks
+            by_version.append(network)  # type: ignore
+        collapsed_v4 = list(ipaddress.collapse_addresses(ipv4_networks))
+        collapsed_v6 = list(ipaddress.collapse_addresses(ipv6_networks))
+
+        self.networks: Tuple[IPNetwork, ...] = (*collapsed_v4, *collapsed_v6)
+        """the collapsed networks, IPv4 ones first, sorted"""
+        self.__v4 = _intervals(collapsed_v4)
+        self.__v6 = _intervals(collapsed_v6)
+
+    def contains(self, address: Union[str, IPAddress, IPNetwork]) -> bool:
+        """
+        :param address: address, or a network which should be
+            entirely included; strings are parsed as addresses
+
+        :returns: True if the address belongs to any of the networks
+
+        :raises ValueError: if a string is not a valid IP address
+        """
+        if isinstance(address, str):
+            address = ipaddress.ip_address(address)
+        if isinstance(address, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+            start = int(address.network_address)
+            end = int(address.broadcast_address)
+        else:
+            start = end = int(address)
+        starts, ends = self.__v4 if address.version == 4 else self.__v6
+        index = bisect_right(starts, start) - 1
+        return index >= 0 and end <= ends[index]
+
+    __contains__ = contains
+
+    def __iter__(self) -> Iterator[IPNetwork]:
+        return iter(self.networks)
+
+    def __len__(self) -> int:
+        return len(self.networks)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NetworkSet):
+            return NotImplemented
+        return self.networks == other.networks
+
+    def __hash__(self) -> int:
+        return hash(self.networks)
+
+    def __repr__(self) -> str:
+        networks = ", ".join(f"'{network}'" for network in self.networks)
+        return f"NetworkSet([{networks}])"
+
+
+@dataclass(frozen=True)
+class NetworkSetTransformer(DataclassTransformer):
+    """
+    Callable parsing a list of networks into a :class:`NetworkSet`
+    """
+
+    __slots__ = ("split_on", "strict")
+
+    split_on: str
+    strict: bool
+
+    def __call__(self, string: str) -> NetworkSet:
+        return NetworkSet(
+            ipaddress.ip_network(item, strict=self.strict)
+            for item in string.split(self.split_on)
+        )
@@ -0,0 +1,139 @@
+"""
+Set of regular expressions, returned by
+:meth:`~env_var.env.as_pattern_list`, matched in a single scan:
+
+.. code-block:: python
+
+    BLOCKED_AGENTS = env("BLOCKED_AGENTS").as_pattern_list().required()
+
+    def handle(request):
+        if BLOCKED_AGENTS.search(request.user_agent):
+            ...
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Pattern, Tuple
+
+from ._transformers.base import DataclassTransformer
+
+# numbered backreferences and conditional group references would
+# point to other groups once the patterns are combined; false positives
+# (e.g. "\\\\1") only make the set fall back to matching one by one
+_NUMBERED_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+class PatternSet:
+    """
+    Patterns combined into a single alternation, each in a named
+    group ``p0``, ``p1``..., so an input is matched against all of
+    them in one scan, and the matched group tells which pattern it
+    was. Patterns that can't be combined (numbered group references,
+    inline flags, clashing group names) are matched one by one.
+
+    :param patterns: patterns to match
+    :param flags: flags the patterns are compiled with
+    """
+
+    __slots__ = ("patterns", "__combined")
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0) -> None:
+        self.patterns: Tuple[Pattern[str], ...] = tuple(
+            re.compile(pattern, flags) for pattern in patterns
+        )
+        """the patterns, compiled one by one"""
+        self.__combined: Optional[Pattern[str]] = self.__combine(flags)
+
+    def __combine(self, flags: int) -> Optional[Pattern[str]]:
+        default_flags = re.compile("", flags).flags
+        for pattern in self.patterns:
+            if pattern.flags != default_flags or _NUMBERED_GROUP_REFERENCE.search(
+                pattern.pattern
+            ):
+                return None
+        try:
+            return re.compile(
+                "|".join(
+                    f"(?P<p{index}>{pattern.pattern})"
+                    for index, pattern in enumerate(self.patterns)
+                ),
+                flags,
+            )
+        except re.error:
+            return None
+
+    @property
+    def combined(self) -> bool:
+        """
+        True if the patterns are matched with a single regex
+        """
+        return self.__combined is not None
+
+    def match(self, string: str) -> Optional[Pattern[str]]:
+        """
+        :returns: the first pattern matching at the beginning
+            of the string, like :func:`re.match`, or None
+        """
+        if self.__combined is None:
+            return next((p for p in self.patterns if p.match(string)), None)
+        found = self.__combined.match(string)
+        return None if found is None else self.__matched(found)
+
+    def search(self, string: str) -> Optional[Pattern[str]]:
+        """
+        :returns: a pattern matching anywhere in the string,
+            like :func:`re.search`, or None; the one matching
+            at the earliest position if combined
+        """
+        if self.__combined is None:
+            return next((p for p in self.patterns if p.search(string)), None)
+        found = self.__combined.search(string)
+        return None if found is None else self.__matched(found)
+
+    def __matched(self, found: "re.Match[str]") -> Pattern[str]:
+        # p<index> groups enclose the whole patterns, so
+        # they are always the last ones to close
+        return self.patterns[int(found.lastgroup[1:])]  # type: ignore
+
+    def __iter__(self) -> Iterator[Pattern[str]]:
+        return iter(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PatternSet):
+            return NotImplemented
+        return self.patterns == other.patterns
+
+    def __hash__(self) -> int:
+        return hash(self.patterns)
+
+    def __repr__(self) -> str:
+        return f"PatternSet({[p.pattern for p in self.patterns]!r})"
+
+
+@dataclass(frozen=True)
+class PatternSetTransformer(DataclassTransformer):
+    """
+    Callable parsing a list of regular expressions into a :class:`PatternSet`
+    """
+
+    __slots__ = ("split_on", "flags")
+
+    split_on: str
+    flags: int
+
+    def __call__(self, string: str) -> PatternSet:
+        items = string.split(self.split_on)
+        try:
+            return PatternSet(items, self.flags)
+        except re.error:
+            for index, item in enumerate(items):
+                try:
+                    re.compile(item, self.flags)
+                except re.error as err:
+                    raise ValueError(
+                        f"item {index} ({item!r}) is not a valid pattern: {err}"
+                    ) from None
+            raise
@@ -0,0 +1,174 @@
+"""
+Results of :meth:`~env_var.env._env.try_required` and
+:meth:`~env_var.env._env.try_optional`, returned instead of raising,
+e.g. when probing many variables or alternative formats:
+
+.. code-block:: python
+
+    result = env("TIMEOUT").as_float().try_required()
+    if result:
+        timeout = result.value
+    else:
+        logger.warning("%s", result.error)
+
+The exception describing a failure is created only when
+:attr:`EnvResult.error` is accessed.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Generic, Mapping, Optional, TypeVar
+
+from .errors import EnvSchemaError, EnvVarNotDefinedError, EnvVarValidationError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .env import _env
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+_NOT_DEFINED = object()
+
+
+class EnvResult(Generic[T]):
+    """
+    Either the parsed value of an environment variable, or the reason
+    it couldn't be returned; truthy only in the former case.
+
+    :param var_name: name of the environment variable
+    :param value: the parsed value
+    :param reason: None on success, otherwise arguments of the
+        transformer's ``ValueError``, or an already created exception
+    """
+
+    __slots__ = ("var_name", "value", "__reason")
+
+    def __init__(
+        self, var_name: str, value: Optional[T] = None, reason: Any = None
+    ) -> None:
+        self.var_name = var_name
+        self.value = value
+        self.__reason = reason
+
+    @classmethod
+    def not_defined(cls, var_name: str) -> "EnvResult[T]":
+        """
+        :returns: result of a required variable that's not set
+        """
+        return cls(var_name, reason=_NOT_DEFINED)
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        """
+        True if the value was parsed (or defaulted) successfully
+        """
+        return self.__reason is None
+
+    def __bool__(self) -> bool:
+        return self.__reason is None
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """
+        :class:`~env_var.errors.EnvVarNotDefinedError` or
+        :class:`~env_var.errors.EnvVarValidationError` describing
+        the failure, None on success
+        """
+        reason = self.__reason
+        if reason is None:
+            return None
+        if reason is _NOT_DEFINED:
+            return EnvVarNotDefinedError(self.var_name)
+        if isinstance(reason, Exception):
+            return reason
+        return EnvVarValidationError(self.var_name, *reason)
+
+    def unwrap(self) -> T:
+        """
+        :returns: the value
+
+        :raises EnvVarNotDefinedError:
+        :raises EnvVarValidationError:
+        """
+        error = self.error
+        if error is not None:
+            raise error
+        return self.value  # type: ignore
+
+    def unwrap_or(self, default: T) -> T:
+        """
+        :returns: the value, or ``default`` on failure
+        """
+        if self.__reason is None:
+            return self.value  # type: ignore
+        return default
+
+    def __repr__(self) -> str:
+        if self.__reason is None:
+            return f"EnvResult({self.var_name!r}, value={self.value!r})"
+        return f"EnvResult({self.var_name!r}, error={str(self.error)!r})"
+
+
+class BatchResult(Generic[K]):
+    """
+    Results of resolving several accessors at once
+
+    :param results: results, under the keys the accessors were given
+    """
+
+    __slots__ = ("results",)
+
+    def __init__(self, results: Dict[K, EnvResult]) -> None:
+        self.results = results
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        """
+        True if all the accessors succeeded
+        """
+        return all(self.results.values())
+
+    @property
+    def values(self) -> Dict[K, Any]:
+        """
+        values of the successful accessors
+        """
+        return {key: result.value for key, result in self.results.items() if result}
+
+    @property
+    def errors(self) -> Dict[K, Exception]:
+        """
+        errors of the failed accessors
+        """
+        return {
+            key: result.error  # type: ignore
+            for key, result in self.results.items()
+            if not result
+        }
+
+    def raise_for_errors(self) -> None:
+        """
+        :raises EnvSchemaError: with all the errors, if there are any
+        """
+        errors = list(self.errors.values())
+        if errors:
+            raise EnvSchemaError(errors)
+
+    def __repr__(self) -> str:
+        return f"BatchResult({self.results!r})"
+
+
+def try_required_all(accessors: Mapping[K, "_env"]) -> BatchResult[K]:
+    """
+    Calls :meth:`~env_var.env._env.try_required` on every accessor
+
+    :param accessors: accessors under arbitrary keys, e.g. setting names
+    """
+    return BatchResult({key: acc.try_required() for key, acc in accessors.items()})
+
+
+def try_optional_all(accessors: Mapping[K, "_env"]) -> BatchResult[K]:
+    """
+    Calls :meth:`~env_var.env._env.try_optional` on every accessor
+
+    :param accessors: accessors under arbitrary keys, e.g. setting names
+    """
+    return BatchResult({key: acc.try_optional() for key, acc in accessors.items()})
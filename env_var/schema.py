@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type, TypeVar
+
+from . import _disk_cache
+from ._compiler import compile_loader
+from .env import _env
+from .errors import EnvSchemaError, EnvVarNotDefinedError, EnvVarValidationError
+from .instrumentation import _hooks
+
+SchemaType = TypeVar("SchemaType", bound="EnvSchema")  # pylint: disable=invalid-name
+
+
+@dataclass(frozen=True)
+class optional:  # pylint: disable=invalid-name
+    """
+    Marks a field of an :class:`EnvSchema` as optional,
+    i.e. resolved with :meth:`~env_var.env._env.optional`
+    instead of :meth:`~env_var.env._env.required`
+    """
+
+    accessor: _env
+
+
+class _SchemaMeta(type):
+    def __new__(cls, name, bases, namespace):
+        fields: Dict[str, Tuple[_env, bool]] = {}
+        for base in reversed(bases):
+            fields.update(getattr(base, "__fields__", {}))
+
+        slots = []
+        for attr, value in list(namespace.items()):
+            if isinstance(value, optional):
+                fields[attr] = (value.accessor, False)
+            elif isinstance(value, _env):
+                fields[attr] = (value, True)
+            else:
+                continue
+            del namespace[attr]
+            slots.append(attr)
+
+        namespace["__slots__"] = tuple(slots)
+        namespace["__fields__"] = fields
+        return super().__new__(cls, name, bases, namespace)
+
+
+class EnvSchema(metaclass=_SchemaMeta):
+    """
+    Base class for declaring many environment variables at once.
+    Fields are declared as class attributes using the :class:`~env_var.env`
+    builder; they're required, unless wrapped with :class:`optional`.
+
+    .. code-block:: python
+
+        class Settings(EnvSchema):
+            port = env("PORT").as_port_number().default(8080)
+            host = env("HOST").as_hostname()
+            debug = optional(env("DEBUG").as_bool())
+
+        settings = Settings.load()
+
+    Instances are immutable and use ``__slots__``.
+    """
+
+    __slots__ = ()
+    __fields__: Dict[str, Tuple[_env, bool]] = {}
+
+    def __init__(self, **values: Any) -> None:
+        for attr in self.__fields__:
+            object.__setattr__(self, attr, values[attr])
+
+    @classmethod
+    def load(
+        cls: Type[SchemaType], environ: Optional[Mapping[str, str]] = None
+    ) -> SchemaType:
+        """
+        Resolves all the fields in a single pass, collecting
+        all the errors instead of stopping on the first one.
+
+        :param environ: mapping to read the variables from (unless
+            a field was declared with its own ``source``),
+            defaults to :data:`os.environ`; pass ``dict(os.environ)``
+            to resolve the fields against a snapshot (copying the whole
+            environment costs more than reading just the declared
+            variables, so it's not done by default)
+
+        :returns: instance of the schema
+
+        :raises EnvSchemaError: listing all the fields
+            that are not defined or not valid
+        """
+        if environ is None:
+            environ = os.environ
+
+        instance = cls.__new__(cls)
+        errors = []
+        instrumented = bool(_hooks)
+        get = environ.get
+        setattr_ = object.__setattr__
+        # pylint: disable=protected-access
+        for attr, (accessor, required) in cls.__fields__.items():
+            try:
+                if instrumented:
+                    val = accessor._getenv_instrumented(environ)
+                else:
+                    # the common case of _env._raw and _env._parse inlined
+                    var_name = accessor._var_name
+                    source = accessor._source
+                    raw = get(var_name) if source is None else source.get(var_name)
+                    if raw is None and accessor._file_suffix is not None:
+                        raw = accessor._raw(environ)
+                    if raw is None:
+                        val = accessor._default
+                    elif accessor._cache is None:
+                        val = accessor._transformer(raw)
+                    else:
+                        val = accessor._parse(raw)
+            except EnvVarValidationError as err:
+                errors.append(err)
+                continue
+            except ValueError as err:
+                errors.append(EnvVarValidationError(accessor.var_name, *err.args))
+                continue
+            if val is None and required:
+                errors.append(EnvVarNotDefinedError(accessor.var_name))
+                continue
+            setattr_(instance, attr, val)
+
+        if errors:
+            raise EnvSchemaError(errors)
+        return instance
+
+    @classmethod
+    def load_cached(
+        cls: Type[SchemaType],
+        path: str,
+        environ: Optional[Mapping[str, str]] = None,
+    ) -> SchemaType:
+        """
+        Like :meth:`load`, but the result is stored in a file and reused
+        as long as the raw values of the declared variables, the schema
+        definition and the library version don't change. Any mismatch
+        or unreadable file results in a full validation.
+
+        The file is unpickled, so it must be only writable by
+        trusted users. Custom transformers are identified by name,
+        so changes in their code aren't detected unless the file
+        declaring the schema changes too.
+
+        :param path: path of the cache file
+        :param environ: see :meth:`load`
+        """
+        if environ is None:
+            environ = os.environ
+
+        key = _disk_cache.cache_key(cls, environ)
+        instance = _disk_cache.read(path, key)
+        if instance.__class__ is cls:
+            return instance
+
+        instance = cls.load(environ)
+        _disk_cache.write(path, key, instance)
+        return instance
+
+    @classmethod
+    def compile(
+        cls: Type[SchemaType],
+    ) -> Callable[[Optional[Mapping[str, str]]], SchemaType]:
+        """
+        Generates a loader function equivalent to :meth:`load`, with
+        numeric conversions and bounds checks inlined and no per-field
+        method calls, for code re-validating its configuration often.
+        The generated source is available as ``loader.__source__``.
+        While instrumentation hooks are registered, the loader falls
+        back to :meth:`load`, so that resolution events are emitted.
+
+        :returns: function taking an optional mapping to read
+            the variables from and returning an instance of the schema
+        """
+        return compile_loader(cls, cls.__fields__, fallback=cls.load)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        :returns: dict mapping field names to their values
+        """
+        return {attr: getattr(self, attr) for attr in self.__fields__}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.as_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for attr, value in state.items():
+            object.__setattr__(self, attr, value)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.as_dict() == other.as_dict()  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, attr) for attr in self.__fields__))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{attr}={val!r}" for attr, val in self.as_dict().items())
+        return f"{self.__class__.__name__}({values})"
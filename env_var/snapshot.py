@@ -0,0 +1,90 @@
+"""
+Sharing resolved settings between processes, e.g. between the master
+and the workers of a pre-fork server: the master resolves the schema
+once and publishes it, the workers attach to the snapshot without
+running any transformer.
+
+.. code-block:: python
+
+    # master, before forking
+    path = snapshot.publish(Settings.load())
+
+    # worker
+    settings = snapshot.attach(path)
+
+The snapshot is a memory mapped file, placed in ``/dev/shm``
+when available, so it's kept in shared memory.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from typing import Any, Optional
+
+_MAGIC = b"ENVVAR\x00\x01"
+_HEADER = struct.Struct(f"<{len(_MAGIC)}sQ")
+_SHM_DIR = "/dev/shm"
+
+
+def publish(settings: Any, path: Optional[str] = None) -> str:
+    """
+    Writes an immutable snapshot of the settings.
+
+    :param settings: resolved settings, usually an instance of
+        :class:`~env_var.schema.EnvSchema`; anything picklable works
+    :param path: where to write the snapshot; by default a new file
+        is created in ``/dev/shm`` (or the temp directory, if there's
+        no ``/dev/shm``)
+
+    :returns: path to pass to :func:`attach`; the publisher is
+        responsible for removing the file with :func:`unlink`
+    """
+    payload = pickle.dumps(settings, protocol=pickle.HIGHEST_PROTOCOL)
+    data = _HEADER.pack(_MAGIC, len(payload)) + payload
+
+    if path is None:
+        directory = _SHM_DIR if os.path.isdir(_SHM_DIR) else None
+        path_fd, path = tempfile.mkstemp(dir=directory, prefix="env_var-")
+        os.close(path_fd)
+
+    # written aside and renamed, so attaching processes
+    # never see a partially written snapshot
+    tmp_fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(tmp_fd, "wb") as file:
+            file.write(data)
+        os.chmod(tmp_path, 0o400)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def attach(path: str) -> Any:
+    """
+    :param path: path returned by :func:`publish`
+
+    :returns: the published settings
+
+    :raises ValueError: if the file is not a valid snapshot
+    """
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if len(buf) < _HEADER.size:
+                raise ValueError(f"{path} is not a valid settings snapshot")
+            magic, size = _HEADER.unpack_from(buf)
+            if magic != _MAGIC or len(buf) != _HEADER.size + size:
+                raise ValueError(f"{path} is not a valid settings snapshot")
+            with memoryview(buf) as view:
+                return pickle.loads(view[_HEADER.size :])
+
+
+def unlink(path: str) -> None:
+    """
+    Removes the snapshot; processes that already attached to it
+    are not affected
+    """
+    os.unlink(path)
@@ -0,0 +1,255 @@
+"""
+Sources environment variables can be read from instead of
+:data:`os.environ`. A source is any ``Mapping[str, str]``,
+passed to the :class:`~env_var.env` builder:
+
+.. code-block:: python
+
+    dotenv = DotEnvSource(".env")
+    port = env("PORT", source=dotenv).as_port_number().required()
+
+Several sources can be layered with :class:`SourceStack`.
+"""
+
+import json
+import os
+from stat import S_ISREG
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from ._sources.dotenv import parse_dotenv
+from ._sources.files import StatKey, read_value, stat_key
+
+
+class Source(Mapping[str, str]):
+    """
+    Base class for sources keeping their variables in a dict;
+    subclasses implement :meth:`_load`
+    """
+
+    def __init__(self) -> None:
+        self._data: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        raise NotImplementedError
+
+    def refresh(self) -> bool:
+        """
+        Loads the variables again
+
+        :returns: True if any variable changed
+        """
+        data = self._load()
+        changed = data != self._data
+        self._data = data
+        return changed
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self._data.get(key, default)
+
+    def __getitem__(self, key: str) -> str:
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DotEnvSource(Source):
+    """
+    Variables read from a ``.env`` file, see
+    :func:`~env_var._sources.dotenv.parse_dotenv_bytes` for the
+    supported syntax. The file is parsed once, :data:`os.environ`
+    is not modified.
+
+    :param path: path to the ``.env`` file
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = path
+        super().__init__()
+
+    def _load(self) -> Dict[str, str]:
+        return parse_dotenv(self.path)
+
+
+class DictSource(Source):
+    """
+    Snapshot of a mapping; :meth:`~Source.refresh` copies it again
+
+    :param mapping: mapping to copy the variables from
+    """
+
+    def __init__(self, mapping: Mapping[str, str]) -> None:
+        self.mapping = mapping
+        super().__init__()
+
+    def _load(self) -> Dict[str, str]:
+        return dict(self.mapping)
+
+
+class EnvironSource(DictSource):
+    """
+    Snapshot of :data:`os.environ`
+    """
+
+    def __init__(self) -> None:
+        super().__init__(os.environ)
+
+
+class JsonFileSource(Source):
+    """
+    Variables read from a JSON file containing a single object.
+    Strings are used as they are, other values are converted
+    back to JSON (e.g. ``true`` or ``[1, 2]``).
+
+    :param path: path to the JSON file
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = path
+        super().__init__()
+
+    def _load(self) -> Dict[str, str]:
+        with open(self.path, "rb") as file:
+            data = json.load(file)
+        if not isinstance(data, dict):
+            raise ValueError(f"{os.fspath(self.path)} should contain a JSON object")
+        return {
+            key: val if isinstance(val, str) else json.dumps(val)
+            for key, val in data.items()
+        }
+
+
+class DirectorySource(Source):
+    """
+    Variables read from a directory containing one file per variable,
+    named after it, like Kubernetes ConfigMaps and Secrets mounted as
+    volumes. Trailing newlines are stripped from the values, files with
+    names starting with a dot are skipped.
+
+    The directory is enumerated with a single :func:`os.scandir`,
+    lookups never touch the filesystem. :meth:`refresh` reads only
+    the files whose inode, mtime or size changed.
+
+    Kubernetes updates such volumes by atomically swapping the ``..data``
+    symlink to a new timestamped directory; when it's present, files are
+    read from its target, so a refresh never mixes two versions, and
+    :meth:`refresh` does nothing as long as the symlink is unchanged.
+
+    :param path: path to the directory
+    """
+
+    DATA_LINK = "..data"
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = path
+        self.__data_target: Optional[str] = None
+        self.__files: Dict[str, Tuple[StatKey, str]] = {}
+        super().__init__()
+
+    def __read_data_link(self) -> Optional[str]:
+        try:
+            return os.readlink(os.path.join(self.path, self.DATA_LINK))
+        except OSError:
+            return None
+
+    def _load(self) -> Dict[str, str]:
+        self.__data_target = self.__read_data_link()
+        directory = (
+            self.path
+            if self.__data_target is None
+            else os.path.join(self.path, self.__data_target)
+        )
+
+        files = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # dangling symlink
+                    continue
+                if not S_ISREG(stat.st_mode):
+                    continue
+
+                key = stat_key(stat)
+                cached = self.__files.get(entry.name)
+                if cached is not None and cached[0] == key:
+                    files[entry.name] = cached
+                else:
+                    files[entry.name] = (key, read_value(entry.path))
+
+        self.__files = files
+        return {name: val for name, (_, val) in files.items()}
+
+    def refresh(self) -> bool:
+        if (
+            self.__data_target is not None
+            and self.__read_data_link() == self.__data_target
+        ):
+            return False
+        return super().refresh()
+
+
+class SourceStack(Source):
+    """
+    Layers several sources, the first one having the highest priority,
+    like :class:`collections.ChainMap`. Unlike the ``ChainMap`` though,
+    all the layers are merged into a single dict up front, so a lookup
+    is a single dict probe.
+
+    .. code-block:: python
+
+        stack = SourceStack(EnvironSource(), DotEnvSource(".env"))
+
+    Mappings other than :class:`Source` instances are copied
+    with :class:`DictSource`.
+
+    :param sources: sources, from the highest priority one
+    """
+
+    def __init__(self, *sources: Mapping[str, str]) -> None:
+        self.layers: List[Source] = [
+            source if isinstance(source, Source) else DictSource(source)
+            for source in sources
+        ]
+        super().__init__()
+
+    def _load(self) -> Dict[str, str]:
+        data: Dict[str, str] = {}
+        for layer in reversed(self.layers):
+            data.update(layer)
+        return data
+
+    def refresh(self, *layers: Source) -> bool:
+        """
+        Refreshes the given layers (all of them by default) and
+        updates the merged index only for the keys of changed layers
+
+        :returns: True if any variable changed
+        """
+        changed_keys = set()
+        for layer in layers or self.layers:
+            old = dict(layer)
+            if layer.refresh():
+                changed_keys.update(old.keys() ^ layer.keys())
+                changed_keys.update(
+                    key for key, val in layer.items() if old.get(key) != val
+                )
+
+        changed = False
+        for key in changed_keys:
+            val = next((layer[key] for layer in self.layers if key in layer), None)
+            if val is None:
+                changed = self._data.pop(key, None) is not None or changed
+            elif self._data.get(key) != val:
+                self._data[key] = val
+                changed = True
+        return changed
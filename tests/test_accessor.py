@@ -0,0 +1,58 @@
+import pickle
+from dataclasses import FrozenInstanceError
+from unittest import TestCase
+
+from env_var import env
+from env_var.cache import ParseCache
+
+from .helpers import VAR_NAME, set_var
+
+
+class TestAccessor(TestCase):
+    def test_immutable(self):
+        accessor = env(VAR_NAME).as_int()
+        with self.assertRaises(FrozenInstanceError):
+            accessor._default = 1  # pylint: disable=attribute-defined-outside-init
+        with self.assertRaises(AttributeError):
+            accessor.other = 1  # pylint: disable=attribute-defined-outside-init
+
+    def test_builders_return_copies(self):
+        set_var()
+        accessor = env(VAR_NAME).as_int()
+        with_default = accessor.default(1)
+
+        self.assertIsNot(with_default, accessor)
+        self.assertEqual(with_default.required(), 1)
+        self.assertIsNone(accessor.optional())
+        self.assertIsNone(accessor.cached()._components()[3])
+        self.assertEqual(with_default.cached()._components()[3], 1)
+
+    def test_equality_and_hash(self):
+        cache = ParseCache()
+        source = {VAR_NAME: "1"}
+        first = env(VAR_NAME, source=source).as_port_number().default(1).cached(cache)
+        second = env(VAR_NAME, source=source).as_port_number().default(1).cached(cache)
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(len({first, second}), 1)
+
+        self.assertNotEqual(first, first.default(2))
+        self.assertNotEqual(first, env(VAR_NAME, source=dict(source)).as_port_number())
+        self.assertNotEqual(first, env(VAR_NAME).as_port_number().default(1))
+        # unhashable defaults are fine
+        hash(env(VAR_NAME).as_int_list().default([1]))
+
+    def test_pickle(self):
+        accessor = env(VAR_NAME).as_port_number().default(80).allow_file()
+        self.assertEqual(pickle.loads(pickle.dumps(accessor)), accessor)
+
+    def test_num_transformers_interned(self):
+        first = env(VAR_NAME).as_int(min=1)._components()[1]
+        self.assertIs(env(VAR_NAME).as_int(min=1)._components()[1], first)
+        self.assertIsNot(env(VAR_NAME).as_int(min=2)._components()[1], first)
+        self.assertIsNot(env(VAR_NAME).as_float(min=1)._components()[1], first)
+        # equal bounds of different types are reported differently
+        float_bound = env(VAR_NAME).as_int(min=1.0)._components()[1]
+        self.assertIsNot(float_bound, first)
+        self.assertEqual(float_bound.min.__class__, float)
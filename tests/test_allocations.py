@@ -0,0 +1,54 @@
+import os
+from unittest import TestCase
+
+from benchmarks.allocations import CASES, ENVIRON, measure_allocations
+
+# roughly twice the values measured on CPython 3.11, regressions
+# in env.py usually show up as multiples of these
+PEAK_BYTES_THRESHOLDS = {
+    "env().as_int().required()": 1024,
+    "module level accessor .required()": 256,
+    "as_int_list[1000].required()": 200_000,
+    "as_list_iter[1000] summed": 10_000,
+    "EnvSchema.load()": 1536,
+    "EnvSchema.compile()()": 1536,
+}
+# objects allocated during the call, even if freed before its end
+PEAK_BLOCKS_THRESHOLDS = {
+    "env().as_int().required()": 18,
+    "module level accessor .required()": 12,
+    "as_int_list[1000].required()": 3500,
+    "as_list_iter[1000] summed": 16,
+    "EnvSchema.load()": 28,
+    "EnvSchema.compile()()": 28,
+}
+RETAINED_BLOCKS_THRESHOLDS = {
+    "env().as_int().required()": 2,
+    "module level accessor .required()": 2,
+    "as_int_list[1000].required()": 1100,
+    "as_list_iter[1000] summed": 4,
+    "EnvSchema.load()": 10,
+    "EnvSchema.compile()()": 10,
+}
+
+
+class TestAllocations(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.old_environ = dict(os.environ)
+        os.environ.update(ENVIRON)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.environ.clear()
+        os.environ.update(cls.old_environ)
+
+    def test_thresholds(self):
+        for name, func in CASES.items():
+            with self.subTest(name):
+                stats = measure_allocations(func)
+                self.assertLessEqual(stats.peak_bytes, PEAK_BYTES_THRESHOLDS[name])
+                self.assertLessEqual(stats.peak_blocks, PEAK_BLOCKS_THRESHOLDS[name])
+                self.assertLessEqual(
+                    stats.retained_blocks, RETAINED_BLOCKS_THRESHOLDS[name]
+                )
@@ -0,0 +1,89 @@
+import pickle
+from array import array
+from unittest import TestCase, skipIf
+
+from env_var import env
+from env_var._transformers.arrays import array_transformer_factory, numpy
+from env_var.errors import EnvVarValidationError
+
+from .helpers import VAR_NAME
+
+
+class ArrayTests:
+    use_numpy = False
+
+    def parse(self, val, type_=int, **kwargs):
+        transformer = array_transformer_factory(
+            type_, use_numpy=self.use_numpy, **kwargs
+        )
+        return env(VAR_NAME, source={VAR_NAME: val}).custom_transformer(transformer)
+
+    def assert_invalid(self, accessor, message):
+        with self.assertRaises(EnvVarValidationError) as raised:
+            accessor.required()
+        self.assertEqual(
+            str(raised.exception),
+            f'error while validating env var "{VAR_NAME}": {message}',
+        )
+
+    def test_ints(self):
+        self.assertEqual(list(self.parse("1,-2,3").required()), [1, -2, 3])
+        self.assertEqual(list(self.parse("1 2", split_on=" ").required()), [1, 2])
+        self.assertEqual(list(self.parse("10,f", base=16).required()), [16, 15])
+        self.assertEqual(list(self.parse("0x10,0o7", base=0).required()), [16, 7])
+
+    def test_floats(self):
+        self.assertEqual(
+            list(self.parse("1.5,-2,3e2", float).required()), [1.5, -2, 300]
+        )
+
+    def test_invalid_items(self):
+        self.assert_invalid(self.parse("1,2,x"), "item 2 ('x') is not a valid int")
+        self.assert_invalid(self.parse("1,1.5"), "item 1 ('1.5') is not a valid int")
+        self.assert_invalid(self.parse(""), "item 0 ('') is not a valid int")
+        self.assert_invalid(
+            self.parse("1,9223372036854775808"),
+            "item 1 ('9223372036854775808') doesn't fit in a 64-bit int",
+        )
+        self.assert_invalid(
+            self.parse("1.5,a", float), "item 1 ('a') is not a valid float"
+        )
+
+    def test_bounds(self):
+        accessor = self.parse("5,1,10,11,0", min=1, max=10)
+        self.assert_invalid(accessor, "item 3 should be less or equal 10")
+        accessor = self.parse("5,1,10,0,11", min=1, max=10)
+        self.assert_invalid(accessor, "item 3 should be bigger or equal 1")
+        accessor = self.parse("0.5,-0.5", float, min=0.0)
+        self.assert_invalid(accessor, "item 1 should be bigger or equal 0.0")
+        self.assertEqual(list(self.parse("1,10", min=1, max=10).required()), [1, 10])
+
+    def test_pickle(self):
+        transformer = array_transformer_factory(int, min=1, use_numpy=self.use_numpy)
+        self.assertEqual(pickle.loads(pickle.dumps(transformer)), transformer)
+
+
+class TestArrayModule(ArrayTests, TestCase):
+    def test_type(self):
+        self.assertIsInstance(self.parse("1,2").required(), array)
+        self.assertEqual(self.parse("1,2").required().typecode, "q")
+        self.assertEqual(self.parse("1,2", float).required().typecode, "d")
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestNumpy(ArrayTests, TestCase):
+    use_numpy = True
+
+    def test_type(self):
+        self.assertEqual(self.parse("1,2").required().dtype, numpy.int64)
+        self.assertEqual(self.parse("1,2", float).required().dtype, numpy.float64)
+
+
+class TestAccessors(TestCase):
+    def test_default_backend(self):
+        source = {VAR_NAME: "1,2,3"}
+        ints = env(VAR_NAME, source=source).as_int_array(min_item_value=1).required()
+        floats = env(VAR_NAME, source=source).as_float_array().required()
+        self.assertEqual(list(ints), [1, 2, 3])
+        self.assertEqual(list(floats), [1.0, 2.0, 3.0])
+        self.assertIsInstance(ints, array if numpy is None else numpy.ndarray)
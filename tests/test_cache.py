@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+from env_var import env
+from env_var.cache import ParseCache, default_cache
+from env_var.errors import EnvVarValidationError
+
+from .helpers import VAR_NAME, check_validators, set_var
+
+
+class CountingTransformer:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, s: str) -> int:
+        self.calls += 1
+        return int(s)
+
+
+class TestCache(TestCase):
+    def test_cached_validators(self):
+        valid_values = (("10", 10), ("-3", -3))
+        invalid_values = ("a", "1.5")
+        check_validators(
+            self,
+            env(VAR_NAME).as_int().cached(ParseCache()),
+            valid_values,
+            invalid_values,
+        )
+
+    def test_reparses_only_on_change(self):
+        transformer = CountingTransformer()
+        cache = ParseCache()
+        accessor = env(VAR_NAME).custom_transformer(transformer).cached(cache)
+
+        set_var("1")
+        for _ in range(5):
+            self.assertEqual(accessor.required(), 1)
+        self.assertEqual(transformer.calls, 1)
+
+        set_var("2")
+        self.assertEqual(accessor.required(), 2)
+        self.assertEqual(transformer.calls, 2)
+
+        info = cache.info()
+        self.assertEqual(info.hits, 4)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_errors_are_not_cached(self):
+        transformer = CountingTransformer()
+        cache = ParseCache()
+        accessor = env(VAR_NAME).custom_transformer(transformer).cached(cache)
+
+        set_var("a")
+        for _ in range(3):
+            with self.assertRaises(EnvVarValidationError):
+                accessor.required()
+        self.assertEqual(transformer.calls, 3)
+        self.assertEqual(cache.info().currsize, 0)
+
+    def test_lru_eviction(self):
+        transformer = CountingTransformer()
+        cache = ParseCache(maxsize=2)
+        accessor = env(VAR_NAME).custom_transformer(transformer).cached(cache)
+
+        for val in ("1", "2", "1", "3"):
+            set_var(val)
+            accessor.required()
+        # "2" was the least recently used one
+        self.assertEqual(cache.info().currsize, 2)
+        set_var("1")
+        accessor.required()
+        self.assertEqual(transformer.calls, 3)
+        set_var("2")
+        accessor.required()
+        self.assertEqual(transformer.calls, 4)
+
+    def test_keyed_on_transformer(self):
+        cache = ParseCache()
+        set_var("10")
+        self.assertEqual(env(VAR_NAME).as_int().cached(cache).required(), 10)
+        self.assertEqual(env(VAR_NAME).as_int(base=16).cached(cache).required(), 16)
+        self.assertEqual(cache.info().misses, 2)
+
+    def test_default_cache(self):
+        default_cache.clear()
+        set_var("42")
+        accessor = env(VAR_NAME).as_int().cached()
+        accessor.required()
+        accessor.required()
+        self.assertEqual(default_cache.hits, 1)
+        self.assertEqual(default_cache.misses, 1)
+        default_cache.clear()
+        self.assertEqual(default_cache.info().currsize, 0)
+
+    def test_inline_accessors_hit(self):
+        cache = ParseCache()
+        set_var("1")
+        for _ in range(5):
+            env(VAR_NAME).as_string().cached(cache).required()
+            env(VAR_NAME).as_string_list().cached(cache).required()
+            env(VAR_NAME).as_list(int, split_on=";").cached(cache).required()
+            env(VAR_NAME).should_match("[0-9]").cached(cache).required()
+            env(VAR_NAME).as_int().cached(cache).required()
+        self.assertEqual(cache.info(), (20, 5, 128, 5))
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ParseCache(maxsize=0)
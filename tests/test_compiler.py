@@ -0,0 +1,69 @@
+from enum import IntEnum
+from unittest import TestCase
+
+from env_var import EnvSchema, env, optional
+from env_var.cache import ParseCache
+from env_var.errors import EnvSchemaError
+
+
+class Limit(IntEnum):
+    LOW = 1
+    HIGH = 10
+
+
+class Settings(EnvSchema):
+    port = env("PORT").as_port_number().default(8080)
+    workers = env("WORKERS").as_int(base=16, min=1)
+    ratio = optional(env("RATIO").as_float(min=0, max=float("inf")))
+    negative = optional(env("NEGATIVE").as_float_negative())
+    host = env("HOST").as_hostname().cached(ParseCache())
+    debug = optional(env("DEBUG").as_bool())
+    names = optional(env("NAMES").as_string_list())
+
+
+ENVIRONS = (
+    {"WORKERS": "a", "HOST": "localhost"},
+    {"PORT": "80", "WORKERS": "1", "HOST": "example.com", "RATIO": "0.5"},
+    {"WORKERS": "ff", "HOST": "h", "DEBUG": "yes", "NAMES": "a,b"},
+    {"WORKERS": "ff", "HOST": "h", "RATIO": "inf", "NEGATIVE": "-2"},
+    {"PORT": "0", "WORKERS": "0", "HOST": "-", "RATIO": "-1", "DEBUG": "?"},
+    {"PORT": "x", "NEGATIVE": "0"},
+    {},
+)
+
+
+class TestCompiler(TestCase):
+    def test_same_as_load(self):
+        loader = Settings.compile()
+        for environ in ENVIRONS:
+            try:
+                expected = Settings.load(environ)
+            except EnvSchemaError as err:
+                with self.assertRaises(EnvSchemaError) as ctx:
+                    loader(environ)
+                self.assertEqual(
+                    [str(e) for e in ctx.exception.errors],
+                    [str(e) for e in err.errors],
+                )
+            else:
+                self.assertEqual(loader(environ), expected)
+
+    def test_reads_os_environ_by_default(self):
+        loader = Settings.compile()
+        with self.assertRaises(EnvSchemaError) as ctx:
+            loader()
+        self.assertIn('"WORKERS"', str(ctx.exception))
+
+    def test_numeric_checks_are_inlined(self):
+        source = Settings.compile().__source__
+        self.assertIn("if val > 65535:", source)
+        self.assertIn("(raw, 16)", source)
+
+    def test_numeric_subclass_bounds(self):
+        class Bounded(EnvSchema):
+            level = env("LEVEL").as_int(min=Limit.LOW, max=Limit.HIGH)
+
+        loader = Bounded.compile()
+        self.assertEqual(loader({"LEVEL": "5"}).level, 5)
+        with self.assertRaises(EnvSchemaError):
+            loader({"LEVEL": "11"})
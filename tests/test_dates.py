@@ -1,12 +1,118 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from itertools import product
 from unittest import TestCase
 
+from dateutil import parser
+from isoduration import parse_duration
 from isoduration.types import DateDuration, Decimal, Duration, TimeDuration
+from rfc3339_validator import validate_rfc3339
 
 from env_var import env
+from env_var._transformers.date import (
+    iso_date_validator,
+    iso_datetime_transformer,
+    iso_timedelta_transformer,
+)
 
 from .helpers import VAR_NAME, check_validators
 
+# date, time, fraction, offset and separator variants,
+# combined into the differential corpus
+DATES = (
+    "2022-04-09",
+    "2024-02-29",
+    "2023-02-29",
+    "0000-01-01",
+    "0001-01-01",
+    "9999-12-31",
+    "2022-13-01",
+    "2022-00-10",
+    "2022-04-31",
+    "20220409",
+    "2022-W14-6",
+)
+TIMES = ("00:00:00", "23:59:59", "24:00:00", "23:60:00", "23:59:60", "013003", "01:30")
+FRACTIONS = ("", ".1", ".602", ".123456", ".1234567", ",5", ".")
+OFFSETS = (
+    "",
+    "Z",
+    "z",
+    "+00:00",
+    "-00:00",
+    "+05:30",
+    "-23:59",
+    "+24:00",
+    "+05:60",
+    "+0530",
+    "+05",
+    "+5:30",
+)
+SEPARATORS = ("T", " ", "t")
+EXTRA = ("", "2022", "2022-04", "2022-04-09T", "2022-04-09T01:30:03Z\n", "٢٠٢٢-04-09")
+
+
+def corpus():
+    yield from EXTRA
+    yield from DATES
+    for day, sep, time, fraction, offset in product(
+        DATES, SEPARATORS, TIMES, FRACTIONS, OFFSETS
+    ):
+        yield f"{day}{sep}{time}{fraction}{offset}"
+
+
+DURATIONS = (
+    "PT30S",
+    "P1D",
+    "PT5M",
+    "P1W",
+    "P1.5W",
+    "P1,5D",
+    "PT0.5S",
+    "PT0.0000005S",
+    "PT0.0000015S",
+    "PT36H",
+    "PT1.5H30M",
+    "P1DT2H3M4.5S",
+    "P0D",
+    "-P1DT1S",
+    "+PT1H",
+    "P1Y",
+    "P1Y2M3DT4H",
+    "P2M",
+    "P-1D",
+    "P0001-02-03T04:05:06",
+    "P",
+    "PT",
+    "P1DT",
+    "P1W1D",
+    "P1H",
+    "PT1D",
+    "p1d",
+    "1D",
+    "P1.D",
+    "P.5D",
+    "",
+)
+
+
+def duration_timedelta(s):
+    duration = parse_duration(s)
+    if duration.date.years or duration.date.months:
+        return duration
+    days = duration.date.weeks * 7 + duration.date.days
+    seconds = duration.time.hours * 3600 + duration.time.minutes * 60
+    seconds += duration.time.seconds
+    return timedelta(microseconds=round((days * 86400 + seconds) * 10**6))
+
+
+def outcome(func, s):
+    try:
+        val = func(s)
+    except (ValueError, OverflowError) as err:
+        return type(err)
+    # repr shows the tzinfo class too, e.g. tzutc() vs tzoffset(None, 0)
+    return repr(val)
+
 
 class TestDates(TestCase):
     def test_iso_date(self):
@@ -56,3 +162,39 @@ class TestDates(TestCase):
         check_validators(
             self, env(VAR_NAME).as_iso_duration(), valid_values, invalid_values
         )
+
+    def test_iso_date_matches_dateutil(self):
+        for s in corpus():
+            self.assertEqual(
+                outcome(iso_datetime_transformer, s), outcome(parser.isoparse, s), s
+            )
+
+    def test_iso_date_string_matches_rfc3339_validator(self):
+        for s in corpus():
+            try:
+                iso_date_validator(s)
+                valid = True
+            except ValueError:
+                valid = False
+            self.assertEqual(valid, validate_rfc3339(s), s)
+
+    def test_iso_timedelta(self):
+        valid_values = (
+            ("PT30S", timedelta(seconds=30)),
+            ("P1DT2H", timedelta(days=1, hours=2)),
+            ("-PT1.5M", timedelta(seconds=-90)),
+        )
+        invalid_values = ("P", "PT", "P1W1D", "PT1D", "P99999999999D")
+        check_validators(
+            self, env(VAR_NAME).as_iso_timedelta(), valid_values, invalid_values
+        )
+
+    def test_iso_timedelta_matches_isoduration(self):
+        for s in DURATIONS:
+            self.assertEqual(
+                outcome(iso_timedelta_transformer, s), outcome(duration_timedelta, s), s
+            )
+        # interned
+        self.assertIs(
+            iso_timedelta_transformer("PT5M"), iso_timedelta_transformer("PT5M")
+        )
@@ -0,0 +1,108 @@
+import os
+import tempfile
+from enum import Enum
+from unittest import TestCase
+
+from env_var import EnvSchema, env, optional
+from env_var.errors import EnvSchemaError
+
+CALLS = []
+
+
+def counting_transformer(s: str) -> str:
+    CALLS.append(s)
+    return s.upper()
+
+
+class Color(Enum):
+    RED = "red"
+
+
+def schema_of(accessor):
+    # rebinds the module attribute, like editing the schema between runs,
+    # so that instances can be pickled
+    global ParametrizedSettings  # pylint: disable=global-statement
+
+    class ParametrizedSettings(EnvSchema):
+        value = accessor
+
+    ParametrizedSettings.__qualname__ = "ParametrizedSettings"
+    return ParametrizedSettings
+
+
+class CachedSettings(EnvSchema):
+    name = env("NAME").custom_transformer(counting_transformer)
+    port = env("PORT").as_port_number().default(8080)
+    debug = optional(env("DEBUG").as_bool())
+
+
+class TestDiskCache(TestCase):
+    def setUp(self):
+        CALLS.clear()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "settings.cache")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_warm_start(self):
+        environ = {"NAME": "abc", "PORT": "81"}
+        first = CachedSettings.load_cached(self.path, environ)
+        second = CachedSettings.load_cached(self.path, environ)
+        self.assertEqual(first, CachedSettings(name="ABC", port=81, debug=None))
+        self.assertEqual(second, first)
+        self.assertEqual(CALLS, ["abc"])
+
+    def test_invalidated_on_change(self):
+        CachedSettings.load_cached(self.path, {"NAME": "abc"})
+        settings = CachedSettings.load_cached(self.path, {"NAME": "abc", "DEBUG": "1"})
+        self.assertTrue(settings.debug)
+        settings = CachedSettings.load_cached(self.path, {"NAME": "xyz", "DEBUG": "1"})
+        self.assertEqual(settings.name, "XYZ")
+        self.assertEqual(CALLS, ["abc", "abc", "xyz"])
+
+    def test_unrelated_variables_ignored(self):
+        CachedSettings.load_cached(self.path, {"NAME": "abc"})
+        CachedSettings.load_cached(self.path, {"NAME": "abc", "OTHER": "1"})
+        self.assertEqual(CALLS, ["abc"])
+
+    def test_corrupted_file(self):
+        CachedSettings.load_cached(self.path, {"NAME": "abc"})
+        with open(self.path, "r+b") as file:
+            file.seek(-5, os.SEEK_END)
+            file.write(b"\0\0\0\0\0")
+        settings = CachedSettings.load_cached(self.path, {"NAME": "abc"})
+        self.assertEqual(settings.name, "ABC")
+        self.assertEqual(CALLS, ["abc", "abc"])
+
+    def test_errors_not_cached(self):
+        with self.assertRaises(EnvSchemaError):
+            CachedSettings.load_cached(self.path, {"NAME": "abc", "PORT": "0"})
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_unwritable_location(self):
+        path = os.path.join(self.tmp_dir.name, "missing", "settings.cache")
+        settings = CachedSettings.load_cached(path, {"NAME": "abc"})
+        self.assertEqual(settings.name, "ABC")
+
+    def test_invalidated_on_transformer_parameters(self):
+        cases = (
+            (
+                "5,50",
+                env("VALUE").as_int_list(min_item_value=1),
+                env("VALUE").as_int_list(min_item_value=10),
+            ),
+            ("abc", env("VALUE").should_match("a"), env("VALUE").should_match("b")),
+            (
+                "red",
+                env("VALUE").as_enum(Color),
+                env("VALUE").as_enum(Color, by="name"),
+            ),
+        )
+        for raw, before, after in cases:
+            with self.subTest(raw=raw):
+                environ = {"VALUE": raw}
+                schema_of(before).load_cached(self.path, environ)
+                self.assertTrue(os.path.exists(self.path))
+                with self.assertRaises(EnvSchemaError):
+                    schema_of(after).load_cached(self.path, environ)
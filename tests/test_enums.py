@@ -0,0 +1,144 @@
+import pickle
+from enum import Enum, IntEnum
+from unittest import TestCase
+
+from env_var import env
+from env_var._transformers.enums import enum_transformer_factory
+from env_var.errors import EnvVarValidationError
+
+from .helpers import VAR_NAME, check_validators, set_var
+
+
+class LogLevel(Enum):
+    ERROR = "error"
+    DEBUG = "debug"
+    INFO = "info"
+    WARNING = "warning"
+    WARN = "warning"
+
+
+class Swapped(Enum):
+    A = "b"
+    B = "a"
+
+
+class Lenient(Enum):
+    ON = "on"
+    OFF = "off"
+
+    @classmethod
+    def _missing_(cls, value):
+        if value in ("1", "yes"):
+            return cls.ON
+        return None
+
+
+class TestEnums(TestCase):
+    def tearDown(self):
+        set_var()
+
+    def test_by_value(self):
+        valid_values = (
+            ("error", LogLevel.ERROR),
+            ("warning", LogLevel.WARNING),
+        )
+        invalid_values = ("", "ERROR", "WARN", "Error", "nope")
+
+        check_validators(
+            self, env(VAR_NAME).as_enum(LogLevel), valid_values, invalid_values
+        )
+
+    def test_by_name(self):
+        valid_values = (
+            ("ERROR", LogLevel.ERROR),
+            ("WARN", LogLevel.WARNING),
+        )
+        invalid_values = ("error", "Error", "nope")
+
+        check_validators(
+            self,
+            env(VAR_NAME).as_enum(LogLevel, by="name"),
+            valid_values,
+            invalid_values,
+        )
+
+    def test_case_insensitive(self):
+        valid_values = (
+            ("error", LogLevel.ERROR),
+            ("ERROR", LogLevel.ERROR),
+            ("Warn", LogLevel.WARNING),
+            ("WARNING", LogLevel.WARNING),
+        )
+        invalid_values = ("", "err", "nope")
+
+        check_validators(
+            self,
+            env(VAR_NAME).as_enum(LogLevel, by="both", case_sensitive=False),
+            valid_values,
+            invalid_values,
+        )
+
+    def test_values_take_precedence(self):
+        accessor = env(VAR_NAME).as_enum(Swapped, by="both")
+        set_var("a")
+        self.assertIs(accessor.required(), Swapped.B)
+        set_var("A")
+        self.assertIs(accessor.required(), Swapped.A)
+
+    def test_missing_is_honoured(self):
+        valid_values = (
+            ("on", Lenient.ON),
+            ("yes", Lenient.ON),
+            ("1", Lenient.ON),
+        )
+        invalid_values = ("no", "ON")
+
+        check_validators(
+            self, env(VAR_NAME).as_enum(Lenient), valid_values, invalid_values
+        )
+        set_var("yes")
+        with self.assertRaises(EnvVarValidationError):
+            env(VAR_NAME).as_enum(Lenient, by="name").required()
+
+    def test_error_lists_choices(self):
+        set_var("nope")
+        with self.assertRaises(EnvVarValidationError) as ctx:
+            env(VAR_NAME).as_enum(LogLevel).required()
+        self.assertIn("'error', 'debug', 'info', 'warning'", str(ctx.exception))
+
+        with self.assertRaises(EnvVarValidationError) as ctx:
+            env(VAR_NAME).as_enum(LogLevel, by="name").required()
+        self.assertIn("'ERROR', 'DEBUG', 'INFO', 'WARNING'", str(ctx.exception))
+
+    def test_non_string_values(self):
+        class Number(IntEnum):
+            ONE = 1
+
+        set_var("1")
+        with self.assertRaises(EnvVarValidationError):
+            env(VAR_NAME).as_enum(Number).required()
+        set_var("one")
+        self.assertIs(
+            env(VAR_NAME).as_enum(Number, by="name", case_sensitive=False).required(),
+            Number.ONE,
+        )
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            env(VAR_NAME).as_enum(LogLevel, by="label")
+
+        class Ambiguous(Enum):
+            LOWER = "x"
+            UPPER = "X"
+
+        env(VAR_NAME).as_enum(Ambiguous)
+        with self.assertRaises(ValueError):
+            env(VAR_NAME).as_enum(Ambiguous, case_sensitive=False)
+
+    def test_lookup_is_shared(self):
+        first = enum_transformer_factory(LogLevel, "both", False)
+        second = enum_transformer_factory(LogLevel, "both", False)
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertIs(first._table, second._table)  # pylint: disable=protected-access
+        self.assertEqual(pickle.loads(pickle.dumps(first)), first)
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+LAZY_MODULES = (
+    "dateutil.parser",
+    "isoduration",
+    "rfc3339_validator",
+    "rfc3986_validator",
+)
+
+
+def loaded_modules(code: str):
+    # fresh interpreter, so modules imported by other tests don't interfere
+    output = subprocess.check_output(
+        [sys.executable, "-c", f"import sys; {code}; print(*sys.modules)"],
+        text=True,
+    )
+    return set(output.split())
+
+
+class TestImports(TestCase):
+    def test_import_is_lazy(self):
+        modules = loaded_modules("import env_var")
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_cheap_transformers_stay_lazy(self):
+        modules = loaded_modules(
+            "from env_var import env; env('A').as_int(); env('B').as_bool()"
+        )
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_loaded_on_first_use(self):
+        modules = loaded_modules(
+            "from env_var import env; env('A').as_iso_date(); env('B').as_email()"
+        )
+        self.assertIn("dateutil.parser", modules)
+
+    def test_validators_package_not_needed(self):
+        modules = loaded_modules(
+            "from env_var import env; env('A').as_email(); env('B').as_url(); "
+            "env('C').as_uuid()"
+        )
+        self.assertNotIn("validators", modules)
@@ -0,0 +1,106 @@
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+
+from env_var import EnvSchema, env, instrumentation, optional
+from env_var.errors import EnvSchemaError, EnvVarNotDefinedError, EnvVarValidationError
+from env_var.instrumentation import ResolutionEvent
+from env_var.sources import DictSource
+
+from .helpers import VAR_NAME, set_var
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        self.events: List[ResolutionEvent] = []
+        instrumentation.add_hook(self.events.append)
+
+    def tearDown(self):
+        instrumentation.remove_hook(self.events.append)
+        set_var()
+
+    def test_outcomes(self):
+        accessor = env(VAR_NAME).as_int()
+
+        set_var("123")
+        accessor.required()
+        set_var("abc")
+        with self.assertRaises(EnvVarValidationError):
+            accessor.optional()
+        set_var()
+        with self.assertRaises(EnvVarNotDefinedError):
+            accessor.required()
+        accessor.default(1).optional()
+
+        self.assertEqual(
+            [(e.outcome, e.raw_length) for e in self.events],
+            [("ok", 3), ("invalid", 3), ("missing", None), ("default", None)],
+        )
+        for event in self.events:
+            self.assertEqual(event.var_name, VAR_NAME)
+            self.assertEqual(event.source, "os.environ")
+            self.assertEqual(event.transformer, "NumTransformer")
+            self.assertGreaterEqual(event.elapsed_ns, 0)
+
+    def test_error_outcome(self):
+        def broken(_: str):
+            raise KeyError()
+
+        set_var("1")
+        with self.assertRaises(KeyError):
+            env(VAR_NAME).custom_transformer(broken).required()
+        self.assertEqual(self.events[0].outcome, "error")
+        self.assertEqual(self.events[0].transformer, broken.__qualname__)
+
+    def test_sources(self):
+        env("A", source=DictSource({"A": "1"})).as_int().required()
+        self.assertEqual(self.events[-1].source, "DictSource")
+
+        with tempfile.NamedTemporaryFile("w") as file:
+            file.write("secret")
+            file.flush()
+            os.environ[f"{VAR_NAME}_FILE"] = file.name
+            try:
+                env(VAR_NAME).as_string().allow_file().required()
+            finally:
+                del os.environ[f"{VAR_NAME}_FILE"]
+        self.assertEqual(self.events[-1].source, "file")
+        self.assertEqual(self.events[-1].raw_length, 6)
+
+    def test_remove_hook(self):
+        instrumentation.remove_hook(self.events.append)
+        set_var("1")
+        env(VAR_NAME).as_int().required()
+        self.assertEqual(self.events, [])
+        instrumentation.add_hook(self.events.append)
+
+    def test_schema(self):
+        class Schema(EnvSchema):
+            port = env("PORT").as_int()
+            debug = optional(env("DEBUG").as_bool())
+            retries = env("RETRIES").as_int().default(3)
+
+        for load in (Schema.load, Schema.compile()):
+            self.events.clear()
+            self.assertEqual(load({"PORT": "80"}).port, 80)
+            with self.assertRaises(EnvSchemaError):
+                load({"PORT": "x"})
+            self.assertEqual(
+                [(e.var_name, e.outcome) for e in self.events],
+                [
+                    ("PORT", "ok"),
+                    ("DEBUG", "missing"),
+                    ("RETRIES", "default"),
+                    ("PORT", "invalid"),
+                    ("DEBUG", "missing"),
+                    ("RETRIES", "default"),
+                ],
+            )
+            self.assertEqual(self.events[0].source, "dict")
+
+        instrumentation.remove_hook(self.events.append)
+        self.events.clear()
+        Schema.compile()({"PORT": "80"})
+        self.assertEqual(self.events, [])
+        instrumentation.add_hook(self.events.append)
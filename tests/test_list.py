@@ -5,8 +5,9 @@ from unittest import TestCase
 from urllib.parse import ParseResult
 
 from env_var import env
+from env_var.errors import EnvVarValidationError
 
-from .helpers import VAR_NAME, check_validators
+from .helpers import VAR_NAME, check_validators, set_var
 
 
 class TestList(TestCase):
@@ -82,3 +83,72 @@ class TestList(TestCase):
         check_validators(
             self, env(VAR_NAME).as_list(check_list), valid_values, invalid_values
         )
+
+    def test_list_iter(self):
+        set_var("1,2,3")
+        items = env(VAR_NAME).as_list_iter(int).required()
+        self.assertEqual(list(items), [1, 2, 3])
+        # every iteration starts over
+        self.assertEqual(list(items), [1, 2, 3])
+
+        set_var("1::2::")
+        self.assertEqual(
+            list(env(VAR_NAME).as_list_iter(str, split_on="::").required()),
+            ["1", "2", ""],
+        )
+        set_var("")
+        self.assertEqual(list(env(VAR_NAME).as_list_iter(str).required()), [""])
+        set_var()
+
+    def test_list_iter_validates_on_demand(self):
+        seen = []
+
+        def transformer(item):
+            seen.append(item)
+            return int(item)
+
+        set_var("1,2,x")
+        items = iter(env(VAR_NAME).as_list_iter(transformer).required())
+        self.assertEqual(next(items), 1)
+        self.assertEqual(seen, ["1"])
+        self.assertEqual(next(items), 2)
+        with self.assertRaises(EnvVarValidationError):
+            next(items)
+        set_var()
+
+        with self.assertRaises(ValueError):
+            env(VAR_NAME).as_list_iter(int, split_on="")
+
+    def test_set(self):
+        valid_values = (("a,b,c", {"a", "b", "c"}), ("1", {"1"}))
+        invalid_values = ("a,b,a",)
+        check_validators(self, env(VAR_NAME).as_set(str), valid_values, invalid_values)
+
+        set_var("1,2,1")
+        self.assertEqual(
+            env(VAR_NAME).as_set(int, allow_duplicates=True).required(), {1, 2}
+        )
+        # duplicates are found after transforming
+        set_var("1,01")
+        with self.assertRaises(EnvVarValidationError):
+            env(VAR_NAME).as_set(int).required()
+        set_var()
+
+    def test_frozenset(self):
+        valid_values = (("1 2 3", frozenset({1, 2, 3})),)
+        invalid_values = ("1 a", "1 2 1")
+        check_validators(
+            self,
+            env(VAR_NAME).as_frozenset(int, split_on=" "),
+            valid_values,
+            invalid_values,
+        )
+
+    def test_hostname_set(self):
+        valid_values = (
+            ("example.com,Other.Example.COM", {"example.com", "other.example.com"}),
+        )
+        invalid_values = ("example.com,-example", "example.com,EXAMPLE.com")
+        check_validators(
+            self, env(VAR_NAME).as_hostname_set(), valid_values, invalid_values
+        )
@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+from env_var import env
+from env_var.cache import ParseCache
+from env_var.errors import EnvVarNotDefinedError, EnvVarValidationError
+from env_var.metrics import MetricsRegistry, VariableMetrics, hit_ratio
+
+from .helpers import VAR_NAME, set_var
+
+
+class TestMetrics(TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry().install()
+
+    def tearDown(self):
+        self.registry.uninstall()
+        set_var()
+
+    def resolve_all_outcomes(self):
+        accessor = env(VAR_NAME).as_int()
+        set_var("1")
+        accessor.required()
+        accessor.required()
+        set_var("a")
+        with self.assertRaises(EnvVarValidationError):
+            accessor.required()
+        set_var()
+        with self.assertRaises(EnvVarNotDefinedError):
+            accessor.required()
+        accessor.default(1).required()
+
+    def test_snapshot(self):
+        self.resolve_all_outcomes()
+        self.assertEqual(
+            self.registry.snapshot().variables,
+            {VAR_NAME: VariableMetrics(5, 1, 1, 1)},
+        )
+        self.registry.reset()
+        self.assertEqual(self.registry.snapshot().variables, {})
+
+    def test_uninstall(self):
+        self.registry.uninstall()
+        self.resolve_all_outcomes()
+        self.assertEqual(self.registry.snapshot().variables, {})
+        self.registry.install()
+
+    def test_cache_statistics(self):
+        cache = ParseCache()
+        self.registry.track_cache("mine", cache)
+        accessor = env(VAR_NAME).as_int().cached(cache)
+        set_var("1")
+        for _ in range(4):
+            accessor.required()
+        info = self.registry.snapshot().caches["mine"]
+        self.assertEqual((info.hits, info.misses), (3, 1))
+        self.assertEqual(hit_ratio(info), 0.75)
+        self.assertEqual(hit_ratio(ParseCache().info()), 0.0)
+
+    def test_prometheus(self):
+        cache = ParseCache()
+        self.registry.track_cache('we"ird', cache)
+        self.resolve_all_outcomes()
+        text = self.registry.to_prometheus()
+        self.assertIn("# TYPE env_var_lookups_total counter\n", text)
+        self.assertIn(f'env_var_lookups_total{{var="{VAR_NAME}"}} 5\n', text)
+        self.assertIn(
+            f'env_var_validation_failures_total{{var="{VAR_NAME}"}} 1\n', text
+        )
+        self.assertIn(f'env_var_default_fallbacks_total{{var="{VAR_NAME}"}} 1\n', text)
+        self.assertIn(f'env_var_missing_total{{var="{VAR_NAME}"}} 1\n', text)
+        self.assertIn('env_var_cache_hit_ratio{cache="we\\"ird"} 0.0\n', text)
+        self.assertIn("# TYPE env_var_cache_size gauge\n", text)
+        self.assertTrue(text.endswith("\n"))
@@ -0,0 +1,80 @@
+import ipaddress
+import pickle
+from unittest import TestCase
+
+from env_var import env
+from env_var.errors import EnvVarValidationError
+from env_var.networks import NetworkSet
+
+from .helpers import VAR_NAME, check_validators
+
+
+def networks(*nets):
+    return NetworkSet(ipaddress.ip_network(net) for net in nets)
+
+
+class TestNetworkSet(TestCase):
+    def test_collapse(self):
+        network_set = networks(
+            "10.0.0.0/24", "10.0.1.0/24", "10.0.0.128/25", "2001:db8::/32", "::1/128"
+        )
+        self.assertEqual(
+            [str(net) for net in network_set],
+            ["10.0.0.0/23", "::1/128", "2001:db8::/32"],
+        )
+        self.assertEqual(len(network_set), 3)
+
+    def test_contains(self):
+        network_set = networks(
+            "10.0.1.0/24", "10.0.2.0/24", "192.168.0.0/16", "2001:db8::/32"
+        )
+        for address in ("10.0.1.0", "10.0.2.255", "192.168.255.1", "2001:db8::1"):
+            with self.subTest(address):
+                self.assertIn(address, network_set)
+                self.assertTrue(network_set.contains(ipaddress.ip_address(address)))
+        for address in ("10.0.0.255", "10.0.3.0", "9.0.0.0", "2001:db9::", "::"):
+            with self.subTest(address):
+                self.assertNotIn(address, network_set)
+        # adjacent networks are merged into a single interval
+        self.assertIn(ipaddress.ip_network("10.0.1.128/25"), network_set)
+        self.assertNotIn(ipaddress.ip_network("10.0.0.0/22"), network_set)
+        self.assertNotIn("10.0.0.1", NetworkSet([]))
+        with self.assertRaises(ValueError):
+            network_set.contains("10.0.0")
+
+    def test_matches_linear_scan(self):
+        nets = [
+            ipaddress.ip_network(
+                f"10.{i % 7}.{i * 37 % 256}.0/{20 + i % 9}", strict=False
+            )
+            for i in range(200)
+        ]
+        network_set = NetworkSet(nets)
+        for i in range(0, 2**16, 97):
+            address = ipaddress.IPv4Address(0x0A000000 + i * 113)
+            self.assertEqual(
+                address in network_set, any(address in net for net in nets)
+            )
+
+
+class TestAccessor(TestCase):
+    def test_network_list(self):
+        valid_values = (
+            ("10.0.0.0/8", networks("10.0.0.0/8")),
+            ("10.0.0.0/8,::1/128", networks("10.0.0.0/8", "::1/128")),
+        )
+        invalid_values = ("", "10.0.0.1/8", "10.0.0.0/8,lala")
+        check_validators(
+            self, env(VAR_NAME).as_ip_network_list(), valid_values, invalid_values
+        )
+
+    def test_options(self):
+        source = {VAR_NAME: "10.0.0.1/8 192.168.0.0/16"}
+        accessor = env(VAR_NAME, source=source).as_ip_network_list(
+            split_on=" ", strict=False
+        )
+        self.assertIn("10.1.1.1", accessor.required())
+        transformer = accessor._components()[1]
+        self.assertEqual(pickle.loads(pickle.dumps(transformer)), transformer)
+        with self.assertRaises(EnvVarValidationError):
+            env(VAR_NAME, source=source).as_ip_network_list(split_on=" ").required()
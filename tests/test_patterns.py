@@ -0,0 +1,60 @@
+import re
+from unittest import TestCase
+
+from env_var import env
+from env_var.errors import EnvVarValidationError
+from env_var.patterns import PatternSet
+
+from .helpers import VAR_NAME, check_validators
+
+
+class TestPatternSet(TestCase):
+    def test_match(self):
+        pattern_set = PatternSet([r"/api/\d+$", r"/static/", r"/(?P<name>\w+)/edit"])
+        self.assertTrue(pattern_set.combined)
+        self.assertEqual(pattern_set.match("/api/12").pattern, r"/api/\d+$")
+        self.assertEqual(
+            pattern_set.match("/users/edit").pattern, r"/(?P<name>\w+)/edit"
+        )
+        self.assertIsNone(pattern_set.match("/api/12/x"))
+        self.assertIsNone(pattern_set.match("x/static/"))
+        self.assertEqual(pattern_set.search("x/static/").pattern, "/static/")
+        # like a loop over the patterns, the first one matching wins
+        self.assertEqual(PatternSet(["a", "ab"]).match("ab").pattern, "a")
+
+    def test_fallback(self):
+        for patterns in (
+            [r"(a)\1", "b"],
+            ["abc", r"(<)?x(?(1)>|)$"],
+            ["(?i)a", "b"],
+            ["(?P<x>a)", "(?P<x>b)"],
+        ):
+            with self.subTest(patterns):
+                pattern_set = PatternSet(patterns)
+                self.assertFalse(pattern_set.combined)
+                for s in ("aa", "A", "a", "b", "c", "<x>", "<x", "x"):
+                    expected = next((p for p in patterns if re.match(p, s)), None)
+                    found = pattern_set.match(s)
+                    self.assertEqual(None if found is None else found.pattern, expected)
+
+    def test_flags(self):
+        pattern_set = PatternSet(["abc", "def"], re.IGNORECASE)
+        self.assertTrue(pattern_set.combined)
+        self.assertEqual(pattern_set.match("DEF").pattern, "def")
+
+
+class TestAccessor(TestCase):
+    def test_pattern_list(self):
+        valid_values = (
+            ("a+,b", PatternSet(["a+", "b"])),
+            (r"\d{3}", PatternSet([r"\d{3}"])),
+        )
+        invalid_values = ("a,(b", "[")
+        check_validators(
+            self, env(VAR_NAME).as_pattern_list(), valid_values, invalid_values
+        )
+
+    def test_invalid_item(self):
+        accessor = env(VAR_NAME, source={VAR_NAME: "a;b{1,2};("}).as_pattern_list(";")
+        with self.assertRaisesRegex(EnvVarValidationError, r"item 2 \('\('\)"):
+            accessor.required()
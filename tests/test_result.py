@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+from env_var import env
+from env_var.errors import EnvSchemaError, EnvVarNotDefinedError, EnvVarValidationError
+from env_var.instrumentation import add_hook, remove_hook
+from env_var.result import try_optional_all, try_required_all
+
+from .helpers import VAR_NAME, set_var
+
+
+class TestResult(TestCase):
+    def tearDown(self):
+        set_var()
+
+    def test_ok(self):
+        set_var("8080")
+        result = env(VAR_NAME).as_port_number().try_required()
+        self.assertTrue(result)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.value, 8080)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.unwrap(), 8080)
+
+    def test_invalid(self):
+        set_var("70000")
+        accessor = env(VAR_NAME).as_port_number()
+        for result in (accessor.try_required(), accessor.try_optional()):
+            self.assertFalse(result)
+            self.assertIsNone(result.value)
+            self.assertIsInstance(result.error, EnvVarValidationError)
+            with self.assertRaises(EnvVarValidationError) as raised:
+                accessor.required()
+            self.assertEqual(str(result.error), str(raised.exception))
+            self.assertEqual(result.unwrap_or(1), 1)
+            with self.assertRaises(EnvVarValidationError):
+                result.unwrap()
+
+    def test_not_defined(self):
+        set_var()
+        accessor = env(VAR_NAME).as_int()
+        result = accessor.try_required()
+        self.assertFalse(result)
+        self.assertIsInstance(result.error, EnvVarNotDefinedError)
+
+        result = accessor.try_optional()
+        self.assertTrue(result)
+        self.assertIsNone(result.value)
+
+        self.assertEqual(accessor.default(3).try_required().value, 3)
+
+    def test_cached_and_instrumented(self):
+        events = []
+        set_var("x")
+        accessor = env(VAR_NAME).as_int().cached()
+        self.assertIsInstance(accessor.try_required().error, EnvVarValidationError)
+        add_hook(events.append)
+        try:
+            self.assertIsInstance(accessor.try_required().error, EnvVarValidationError)
+            set_var("1")
+            self.assertEqual(accessor.try_required().value, 1)
+        finally:
+            remove_hook(events.append)
+        self.assertEqual([event.outcome for event in events], ["invalid", "ok"])
+
+    def test_batch(self):
+        source = {"PORT": "80", "WORKERS": "-1"}
+        accessors = {
+            "port": env("PORT", source=source).as_port_number(),
+            "workers": env("WORKERS", source=source).as_int_positive(),
+            "debug": env("DEBUG", source=source).as_bool(),
+        }
+
+        batch = try_required_all(accessors)
+        self.assertFalse(batch.ok)
+        self.assertEqual(batch.values, {"port": 80})
+        self.assertEqual(list(batch.errors), ["workers", "debug"])
+        self.assertIsInstance(batch.errors["workers"], EnvVarValidationError)
+        self.assertIsInstance(batch.errors["debug"], EnvVarNotDefinedError)
+        with self.assertRaises(EnvSchemaError) as raised:
+            batch.raise_for_errors()
+        self.assertEqual(len(raised.exception.errors), 2)
+
+        source["WORKERS"] = "1"
+        batch = try_optional_all(accessors)
+        self.assertTrue(batch.ok)
+        self.assertEqual(batch.values, {"port": 80, "workers": 1, "debug": None})
+        batch.raise_for_errors()
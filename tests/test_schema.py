@@ -0,0 +1,64 @@
+import pickle
+from dataclasses import FrozenInstanceError
+from unittest import TestCase
+
+from env_var import EnvSchema, env, optional
+from env_var.errors import EnvSchemaError, EnvVarNotDefinedError, EnvVarValidationError
+
+
+class Settings(EnvSchema):
+    port = env("PORT").as_port_number().default(8080)
+    host = env("HOST").as_hostname()
+    debug = optional(env("DEBUG").as_bool())
+
+
+class ExtendedSettings(Settings):
+    workers = env("WORKERS").as_int_positive()
+
+
+class TestSchema(TestCase):
+    def test_load(self):
+        settings = Settings.load({"HOST": "localhost", "DEBUG": "true"})
+        self.assertEqual(settings.port, 8080)
+        self.assertEqual(settings.host, "localhost")
+        self.assertTrue(settings.debug)
+
+        settings = Settings.load({"HOST": "localhost", "PORT": "80"})
+        self.assertEqual(settings.port, 80)
+        self.assertIsNone(settings.debug)
+
+    def test_all_errors_reported(self):
+        with self.assertRaises(EnvSchemaError) as ctx:
+            Settings.load({"PORT": "0", "DEBUG": "maybe"})
+
+        errors = ctx.exception.errors
+        self.assertEqual(len(errors), 3)
+        self.assertIsInstance(errors[0], EnvVarValidationError)
+        self.assertIsInstance(errors[1], EnvVarNotDefinedError)
+        self.assertIsInstance(errors[2], EnvVarValidationError)
+        self.assertIn('"PORT"', str(ctx.exception))
+        self.assertIn('"HOST"', str(ctx.exception))
+
+    def test_inheritance(self):
+        settings = ExtendedSettings.load({"HOST": "localhost", "WORKERS": "4"})
+        self.assertEqual(settings.workers, 4)
+        self.assertEqual(settings.host, "localhost")
+        self.assertEqual(list(settings.as_dict()), ["port", "host", "debug", "workers"])
+
+    def test_frozen_and_slotted(self):
+        settings = Settings.load({"HOST": "localhost"})
+        with self.assertRaises(FrozenInstanceError):
+            settings.port = 10
+        with self.assertRaises(FrozenInstanceError):
+            del settings.port
+        self.assertFalse(hasattr(settings, "__dict__"))
+
+    def test_eq_repr_pickle(self):
+        settings = Settings.load({"HOST": "localhost"})
+        self.assertEqual(settings, Settings.load({"HOST": "localhost"}))
+        self.assertNotEqual(settings, Settings.load({"HOST": "example.com"}))
+        self.assertEqual(
+            repr(settings), "Settings(port=8080, host='localhost', debug=None)"
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(settings)), settings)
+        self.assertEqual(hash(settings), hash(Settings.load({"HOST": "localhost"})))
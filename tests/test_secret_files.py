@@ -0,0 +1,110 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from env_var import EnvSchema, env
+from env_var.errors import EnvSchemaError, EnvVarNotDefinedError, EnvVarValidationError
+
+from .helpers import VAR_NAME, set_var
+
+FILE_VAR_NAME = f"{VAR_NAME}_FILE"
+
+
+class TestSecretFiles(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "secret")
+        os.environ[FILE_VAR_NAME] = self.path
+
+    def tearDown(self):
+        del os.environ[FILE_VAR_NAME]
+        set_var()
+        self.tmp_dir.cleanup()
+
+    def write(self, content: str):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(content)
+        # make sure the change is visible even on filesystems
+        # with coarse mtime resolution
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    def test_read_from_file(self):
+        self.write("42\n")
+        accessor = env(VAR_NAME).as_int().allow_file()
+        self.assertEqual(accessor.required(), 42)
+
+        self.write("43\n\n")
+        self.assertEqual(accessor.required(), 43)
+
+    def test_cached_until_changed(self):
+        self.write("secret")
+        accessor = env(VAR_NAME).as_string().allow_file()
+        accessor.required()
+        with mock.patch(
+            "env_var._sources.files.open", wraps=open, create=True
+        ) as opened:
+            for _ in range(3):
+                self.assertEqual(accessor.required(), "secret")
+            opened.assert_not_called()
+
+    def test_variable_takes_precedence(self):
+        self.write("from file")
+        set_var("from env")
+        self.assertEqual(env(VAR_NAME).as_string().allow_file().required(), "from env")
+
+    def test_disabled_by_default(self):
+        self.write("secret")
+        with self.assertRaises(EnvVarNotDefinedError):
+            env(VAR_NAME).as_string().required()
+
+    def test_custom_suffix(self):
+        self.write("secret")
+        os.environ[f"{VAR_NAME}_PATH"] = self.path
+        try:
+            accessor = env(VAR_NAME).as_string().allow_file("_PATH")
+            self.assertEqual(accessor.required(), "secret")
+        finally:
+            del os.environ[f"{VAR_NAME}_PATH"]
+
+    def test_missing_file(self):
+        with self.assertRaisesRegex(EnvVarValidationError, FILE_VAR_NAME):
+            env(VAR_NAME).as_string().allow_file().required()
+
+    def test_validation(self):
+        self.write("not a number")
+        with self.assertRaises(EnvVarValidationError):
+            env(VAR_NAME).as_int().allow_file().required()
+
+    def test_schema(self):
+        class Settings(EnvSchema):
+            secret = env(VAR_NAME).as_int().allow_file()
+
+        self.write("1")
+        for load in (Settings.load, Settings.compile()):
+            self.assertEqual(load().secret, 1)
+
+        os.unlink(self.path)
+        for load in (Settings.load, Settings.compile()):
+            with self.assertRaises(EnvSchemaError):
+                load()
+
+        del os.environ[FILE_VAR_NAME]
+        for load in (Settings.load, Settings.compile()):
+            with self.assertRaises(EnvSchemaError) as ctx:
+                load()
+            self.assertIsInstance(ctx.exception.errors[0], EnvVarNotDefinedError)
+        os.environ[FILE_VAR_NAME] = self.path
+
+    def test_schema_load_cached(self):
+        class Settings(EnvSchema):
+            secret = env(VAR_NAME).as_int().allow_file()
+
+        cache_path = self.path + ".cache"
+        self.write("1")
+        self.assertEqual(Settings.load_cached(cache_path).secret, 1)
+
+        os.unlink(self.path)
+        with self.assertRaises(EnvSchemaError) as ctx:
+            Settings.load_cached(cache_path)
+        self.assertIsInstance(ctx.exception.errors[0], EnvVarValidationError)
@@ -0,0 +1,73 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import TestCase
+
+from env_var import EnvSchema, env, optional, snapshot
+
+CALLS = []
+
+
+def counting_transformer(s: str) -> str:
+    CALLS.append(s)
+    return s.upper()
+
+
+class SnapshotSettings(EnvSchema):
+    name = env("NAME").custom_transformer(counting_transformer)
+    hosts = env("HOSTS").as_string_list()
+    debug = optional(env("DEBUG").as_bool())
+
+
+class TestSnapshot(TestCase):
+    def setUp(self):
+        CALLS.clear()
+        self.settings = SnapshotSettings.load({"NAME": "abc", "HOSTS": "a,b"})
+        self.path = snapshot.publish(self.settings)
+
+    def tearDown(self):
+        snapshot.unlink(self.path)
+
+    def test_attach(self):
+        self.assertEqual(snapshot.attach(self.path), self.settings)
+        self.assertEqual(CALLS, ["abc"])
+
+    def test_invalid_snapshot(self):
+        with tempfile.NamedTemporaryFile() as file:
+            file.write(b"definitely not a snapshot")
+            file.flush()
+            with self.assertRaises(ValueError):
+                snapshot.attach(file.name)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_workers(self):
+        children = []
+        for _ in range(4):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:  # pragma: no cover
+                # the child must never return into the test runner
+                status = 1
+                try:
+                    os.close(read_fd)
+                    calls_before = len(CALLS)
+                    settings = snapshot.attach(self.path)
+                    with os.fdopen(write_fd, "wb") as pipe:
+                        pickle.dump(
+                            (settings.as_dict(), len(CALLS) - calls_before), pipe
+                        )
+                    status = 0
+                finally:
+                    os._exit(status)  # pylint: disable=protected-access
+            os.close(write_fd)
+            children.append((pid, read_fd))
+
+        for pid, read_fd in children:
+            with os.fdopen(read_fd, "rb") as pipe:
+                data = pipe.read()
+            _, status = os.waitpid(pid, 0)
+            self.assertEqual(status, 0)
+            values, transformer_calls = pickle.loads(data)
+            self.assertEqual(values, self.settings.as_dict())
+            self.assertEqual(transformer_calls, 0)
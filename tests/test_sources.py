@@ -0,0 +1,265 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase, mock
+
+from env_var import EnvSchema, env
+from env_var._sources.dotenv import parse_dotenv_bytes
+from env_var.errors import EnvVarNotDefinedError
+from env_var.sources import (
+    DictSource,
+    DirectorySource,
+    DotEnvSource,
+    EnvironSource,
+    JsonFileSource,
+    SourceStack,
+)
+
+from .helpers import VAR_NAME, set_var
+
+DOTENV = b"""# comment
+A=1
+export B = hello world # comment
+C=ab#c
+D='literal \\n #not a comment' # comment
+E="line1\\nline2 \\"quoted\\" \\x"
+F="multi
+line"
+
+G=
+H=crlf\r
+I=last"""
+
+
+def write_file(directory: str, name: str, content: bytes) -> str:
+    path = os.path.join(directory, name)
+    with open(path, "wb") as file:
+        file.write(content)
+    return path
+
+
+class TestDotEnvParser(TestCase):
+    def test_parse(self):
+        self.assertEqual(
+            parse_dotenv_bytes(DOTENV),
+            {
+                "A": "1",
+                "B": "hello world",
+                "C": "ab#c",
+                "D": "literal \\n #not a comment",
+                "E": 'line1\nline2 "quoted" \\x',
+                "F": "multi\nline",
+                "G": "",
+                "H": "crlf",
+                "I": "last",
+            },
+        )
+
+    def test_last_value_wins(self):
+        self.assertEqual(parse_dotenv_bytes(b"A=1\nA=2\n"), {"A": "2"})
+
+    def test_invalid_lines(self):
+        for content, line in (
+            (b"A=1\nNOT AN ASSIGNMENT\n", 2),
+            (b'A="unterminated\n', 1),
+            (b"A=1\n\n1A=2", 3),
+            (b"A='1' trailing", 1),
+            (b'A= "x" junk', 1),
+            (b"A=1\nB=\t'x' junk\n", 2),
+        ):
+            with self.assertRaisesRegex(ValueError, f":{line}: invalid line"):
+                parse_dotenv_bytes(content)
+
+
+class TestDotEnvSource(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_env_lookup(self):
+        path = write_file(self.tmp_dir.name, ".env", DOTENV)
+        source = DotEnvSource(path)
+        self.assertEqual(env("A", source=source).as_int().required(), 1)
+        self.assertEqual(env("B", source=source).as_string().required(), "hello world")
+        self.assertIsNone(env("MISSING", source=source).as_string().optional())
+        self.assertNotIn("A", os.environ)
+
+    def test_not_reading_os_environ(self):
+        set_var("1")
+        source = DotEnvSource(write_file(self.tmp_dir.name, ".env", b""))
+        with self.assertRaises(EnvVarNotDefinedError):
+            env(VAR_NAME, source=source).as_int().required()
+        set_var()
+
+    def test_schema(self):
+        source = DotEnvSource(write_file(self.tmp_dir.name, ".env", b"PORT=81"))
+
+        class Settings(EnvSchema):
+            port = env("PORT", source=source).as_port_number()
+            host = env("HOST").as_hostname()
+
+        expected = Settings(port=81, host="localhost")
+        self.assertEqual(Settings.load({"HOST": "localhost", "PORT": "1"}), expected)
+        self.assertEqual(Settings.compile()({"HOST": "localhost"}), expected)
+
+    def test_invalid_file(self):
+        path = write_file(self.tmp_dir.name, ".env", b"A=1\nB\n")
+        with self.assertRaisesRegex(ValueError, r"\.env:2: invalid line"):
+            DotEnvSource(path)
+
+    def test_refresh(self):
+        path = write_file(self.tmp_dir.name, ".env", b"A=1")
+        source = DotEnvSource(path)
+        self.assertFalse(source.refresh())
+        write_file(self.tmp_dir.name, ".env", b"A=2")
+        self.assertTrue(source.refresh())
+        self.assertEqual(dict(source), {"A": "2"})
+
+
+class TestSources(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_environ_source(self):
+        set_var("1")
+        source = EnvironSource()
+        self.assertEqual(source[VAR_NAME], "1")
+        set_var("2")
+        self.assertEqual(source[VAR_NAME], "1")
+        self.assertTrue(source.refresh())
+        self.assertEqual(source[VAR_NAME], "2")
+        set_var()
+
+    def test_dict_source(self):
+        data = {"A": "1"}
+        source = DictSource(data)
+        data["A"] = "2"
+        self.assertEqual(env("A", source=source).as_int().required(), 1)
+        source.refresh()
+        self.assertEqual(env("A", source=source).as_int().required(), 2)
+
+    def test_json_source(self):
+        path = write_file(
+            self.tmp_dir.name,
+            "config.json",
+            b'{"A": "text", "B": true, "C": [1, 2], "D": 1.5}',
+        )
+        source = JsonFileSource(path)
+        self.assertEqual(
+            dict(source), {"A": "text", "B": "true", "C": "[1, 2]", "D": "1.5"}
+        )
+        self.assertTrue(env("B", source=source).as_bool().required())
+
+        path = write_file(self.tmp_dir.name, "list.json", b"[1, 2]")
+        with self.assertRaises(ValueError):
+            JsonFileSource(path)
+
+    def test_directory_source(self):
+        write_file(self.tmp_dir.name, "PASSWORD", b"secret\n")
+        write_file(self.tmp_dir.name, "PORT", b"8080")
+        write_file(self.tmp_dir.name, ".hidden", b"x")
+        os.mkdir(os.path.join(self.tmp_dir.name, "nested"))
+        source = DirectorySource(self.tmp_dir.name)
+        self.assertEqual(dict(source), {"PASSWORD": "secret", "PORT": "8080"})
+
+    def test_stack_priority(self):
+        stack = SourceStack({"A": "1"}, {"A": "2", "B": "2"}, DictSource({"C": "3"}))
+        self.assertEqual(dict(stack), {"A": "1", "B": "2", "C": "3"})
+        self.assertEqual(env("A", source=stack).as_int().required(), 1)
+        self.assertEqual(env("B", source=stack).as_int().required(), 2)
+        self.assertIsNone(env("D", source=stack).as_int().optional())
+
+    def test_stack_refresh(self):
+        top = {"A": "1"}
+        bottom = {"A": "2", "B": "2"}
+        top_source = DictSource(top)
+        stack = SourceStack(top_source, bottom)
+        self.assertFalse(stack.refresh())
+
+        del top["A"]
+        top["C"] = "3"
+        self.assertTrue(stack.refresh(top_source))
+        self.assertEqual(dict(stack), {"A": "2", "B": "2", "C": "3"})
+
+        bottom.clear()
+        self.assertFalse(stack.refresh(top_source))
+        self.assertTrue(stack.refresh())
+        self.assertEqual(dict(stack), {"C": "3"})
+
+    def test_nested_stack(self):
+        inner_data = {"A": "1"}
+        inner = SourceStack(inner_data)
+        stack = SourceStack(inner, {"A": "0", "B": "0"})
+        self.assertEqual(dict(stack), {"A": "1", "B": "0"})
+        inner_data["B"] = "1"
+        self.assertTrue(stack.refresh())
+        self.assertEqual(dict(stack), {"A": "1", "B": "1"})
+
+
+class TestDirectorySource(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = self.tmp_dir.name
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_reads_only_changed_files(self):
+        write_file(self.path, "A", b"1")
+        write_file(self.path, "B", b"2")
+        source = DirectorySource(self.path)
+
+        with mock.patch(
+            "env_var._sources.files.open", wraps=open, create=True
+        ) as opened:
+            self.assertFalse(source.refresh())
+            self.assertEqual(opened.call_count, 0)
+
+            write_file(self.path, "B", b"20")
+            self.assertTrue(source.refresh())
+            self.assertEqual(opened.call_count, 1)
+
+        self.assertEqual(dict(source), {"A": "1", "B": "20"})
+
+    def test_removed_files(self):
+        write_file(self.path, "A", b"1")
+        write_file(self.path, "B", b"2")
+        source = DirectorySource(self.path)
+        os.unlink(os.path.join(self.path, "B"))
+        self.assertTrue(source.refresh())
+        self.assertEqual(dict(source), {"A": "1"})
+
+    def publish(self, version: str, files: dict):
+        """
+        mimics the way kubelet updates ConfigMap volumes
+        """
+        data_dir = f"..{version}"
+        os.mkdir(os.path.join(self.path, data_dir))
+        for name, content in files.items():
+            write_file(os.path.join(self.path, data_dir), name, content)
+            link = os.path.join(self.path, name)
+            if not os.path.islink(link):
+                os.symlink(os.path.join("..data", name), link)
+        tmp_link = os.path.join(self.path, "..data_tmp")
+        os.symlink(data_dir, tmp_link)
+        os.replace(tmp_link, os.path.join(self.path, "..data"))
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "requires symlinks")
+    def test_kubernetes_volume(self):
+        self.publish("v1", {"A": b"1\n", "B": b"2"})
+        source = DirectorySource(self.path)
+        self.assertEqual(dict(source), {"A": "1", "B": "2"})
+
+        with mock.patch("env_var.sources.os.scandir") as scandir:
+            self.assertFalse(source.refresh())
+            scandir.assert_not_called()
+
+        self.publish("v2", {"A": b"10", "B": b"2"})
+        self.assertTrue(source.refresh())
+        self.assertEqual(dict(source), {"A": "10", "B": "2"})
+        self.assertEqual(env("A", source=source).as_int().required(), 10)
@@ -1,10 +1,139 @@
+from itertools import product
 from unittest import TestCase
 
+import validators
+
 from env_var import env
+from env_var._transformers.string_validators import (
+    email_validator,
+    url_validator,
+    uuid_validator,
+)
 from env_var.errors import EnvVarValidationError
 
 from .helpers import VAR_NAME, check_validators, set_var
 
+# url parts combined into the differential corpus; the
+# validators package is the reference implementation
+SCHEMES = ("http://", "HTTPS://", "ftp://", "ftps://", "http:/", "")
+USER_INFO = ("", "user@", "user:pa:ss@", "us%20er:@", "@", ":@", "user/x@", "ü@")
+HOSTS = (
+    "example.com",
+    "EXAMPLE.COM",
+    "localhost",
+    "LocalHost",
+    "my-server",
+    "a.b-c.de",
+    "a--b.com",
+    "xn--bcher-kva.example",
+    "a-xn--b.com",
+    "axn--b.com",
+    "xn---b.com",
+    "-a.com",
+    "a-.com",
+    "a..com",
+    ".a.com",
+    "a.com.",
+    "example.c",
+    "example.c0m",
+    "example.xn--p1ai",
+    "dömain.tld",
+    "exa_mple.com",
+    "10.0.0.1",
+    "127.0.0.1",
+    "172.16.0.1",
+    "172.32.0.1",
+    "192.168.1.100",
+    "169.254.1.1",
+    "8.8.8.8",
+    "0.0.0.0",
+    "224.0.0.1",
+    "1.2.3.256",
+    "1.2.3",
+    "[::1]",
+    "[2001:db8::8a2e:370:7334]",
+    "[fe80::7:8%eth0]",
+    "[::ffff:192.0.2.128]",
+    "[::1",
+    "[]",
+    "",
+)
+TAILS = (
+    "",
+    ":8080",
+    ":1",
+    ":123456",
+    ":port",
+    "/",
+    "/a/b@c;d=e",
+    "/a b",
+    "/a<b",
+    "?q=1&r=[]",
+    "?q= 1",
+    "#frag",
+    "/p?q#f",
+    "#f?q",
+    "\n",
+    "\n\n",
+    " ",
+)
+EMAILS = (
+    "test@test.com",
+    "some.dude@example.com",
+    "first.last+tag@sub.example.co.uk",
+    "UPPER@EXAMPLE.COM",
+    "user@localhost",
+    "user@[192.168.0.1]",
+    "user@[256.1.1.1]",
+    '"quoted user"@example.com',
+    '"quo\\"ted"@example.com',
+    "user@dömain.de",
+    "user@xn--dmain-jua.de",
+    "user@example.c",
+    "user@example.c0m\n",
+    "user@example.com\n",
+    "user@-example.com",
+    "user@example..com",
+    "a@b@example.com",
+    ".user@example.com",
+    "user.@example.com",
+    "us..er@example.com",
+    "not-a valid@email.com",
+    "x" * 64 + "@example.com",
+    "x" * 65 + "@example.com",
+    "user@",
+    "@example.com",
+    "dsa1",
+    "",
+)
+UUIDS = (
+    "26f47ed0-b7a4-11ec-b909-0242ac120002",
+    "26F47ED0-B7A4-11EC-B909-0242AC120002",
+    "26f47ed0-b7a4-11ec-b909-0242ac120002\n",
+    "26f47ed0-b7a4-11ec-b909-0242ac120002\n\n",
+    "26f47ed0-b7a4-11ec-b909-0242ac12000",
+    "26f47ed0-b7a4-11ec-b909-0242ac1200020",
+    "26f47ed0b7a411ecb9090242ac120002",
+    "26f47ed0-b7a4-11ec-b909_0242ac120002",
+    "26f47ed0-b7a4-11ec-b9090-242ac120002",
+    "g6f47ed0-b7a4-11ec-b909-0242ac120002",
+    "{26f47ed0-b7a4-11ec-b909-0242ac120002}",
+    "",
+)
+
+
+def url_corpus():
+    for scheme, user_info, host, tail in product(SCHEMES, USER_INFO, HOSTS, TAILS):
+        yield f"{scheme}{user_info}{host}{tail}"
+
+
+def is_valid(validator, s):
+    try:
+        validator(s)
+    except ValueError:
+        return False
+    return True
+
 
 class TestValidators(TestCase):
     def test_email(self):
@@ -76,6 +205,20 @@ class TestValidators(TestCase):
 
         check_validators(self, env(VAR_NAME).as_uuid(), valid_values, invalid_values)
 
+    def test_url_matches_validators_package(self):
+        for s in url_corpus():
+            self.assertEqual(is_valid(url_validator, s), validators.url(s) is True, s)
+
+    def test_email_matches_validators_package(self):
+        for s in EMAILS:
+            self.assertEqual(
+                is_valid(email_validator, s), validators.email(s) is True, s
+            )
+
+    def test_uuid_matches_validators_package(self):
+        for s in UUIDS:
+            self.assertEqual(is_valid(uuid_validator, s), validators.uuid(s) is True, s)
+
     def test_own_regex(self):
         set_var("testing_is_very_important")
 